@@ -1,27 +1,32 @@
 """OpenCodeReview - Portable code review specification."""
 
-from .io import dump, load
-from .models import (
-    Activity,
-    AgentContext,
-    Assignment,
-    Author,
-    Comment,
-    Location,
-    Mention,
-    Resolution,
-    Retraction,
-    Review,
-    ReviewMark,
-    Selector,
-    StatusChange,
-    Subject,
-    Verdict,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .io import dump, load, load_raw
+    from .models import (
+        Activity,
+        AgentContext,
+        Assignment,
+        Author,
+        Comment,
+        Location,
+        Mention,
+        Resolution,
+        Retraction,
+        Review,
+        ReviewMark,
+        Selector,
+        StatusChange,
+        Subject,
+        Verdict,
+    )
 
 __all__ = [
     # I/O
     "load",
+    "load_raw",
     "dump",
     # Models
     "Review",
@@ -42,3 +47,39 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# Submodule defining each public name. Submodules are imported on first
+# attribute access, so importing the package itself stays cheap.
+_LAZY = {
+    "load": "io",
+    "load_raw": "io",
+    "dump": "io",
+    "Review": "models",
+    "Activity": "models",
+    "Comment": "models",
+    "ReviewMark": "models",
+    "Resolution": "models",
+    "Retraction": "models",
+    "Mention": "models",
+    "Assignment": "models",
+    "StatusChange": "models",
+    "Verdict": "models",
+    "Subject": "models",
+    "Location": "models",
+    "Selector": "models",
+    "Author": "models",
+    "AgentContext": "models",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,14 @@
 """CLI tools for OpenCodeReview."""
 
+import copy
+import hashlib
+import importlib.util
 import json
+import os
+import re
 import sys
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 
 try:
@@ -12,6 +19,10 @@ except ImportError:
 import opencodereview as ocr
 
 
+# Below this many files, starting worker processes costs more than it saves
+_MIN_PARALLEL_FILES = 4
+
+
 def _require_click():
     if click is None:
         print("Error: click not installed. Run: pip install opencodereview[tools]", file=sys.stderr)
@@ -21,51 +32,62 @@ def _require_click():
 def validate_main():
     """Validate OpenCodeReview files against the schema."""
     _require_click()
+    _validate_command()()
 
-    try:
-        import jsonschema
-    except ImportError:
-        print("Error: jsonschema not installed. Run: pip install opencodereview[tools]", file=sys.stderr)
-        sys.exit(1)
 
+@lru_cache(maxsize=1)
+def _validate_command():
+    """Build the ocr-validate click command once per process."""
     @click.command()
     @click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
-    @click.option("-q", "--quiet", is_flag=True, help="Only output errors")
-    def validate(files, quiet):
+    @click.option("-q", "--quiet", is_flag=True, help="Only output failures, with the first schema error per file")
+    @click.option("-j", "--jobs", type=click.IntRange(min=1), default=1, help="Number of worker processes (default: 1)")
+    @click.option("--schema-only", is_flag=True, help="Check YAML/JSON files against the schema as written, without the Pydantic model")
+    @click.option("--batch", is_flag=True, help="Validate all files in a single schema pass (ignores --jobs)")
+    def validate(files, quiet, jobs, schema_only, batch):
         """Validate OpenCodeReview files against the JSON schema."""
-        schema = _load_schema()
+        # Build validators up front: fails early if jsonschema or the schema is missing
+        try:
+            _get_batch_validators() if batch else _get_validators()
+        except ImportError:
+            click.echo("Error: jsonschema not installed. Run: pip install opencodereview[tools]", err=True)
+            sys.exit(1)
         exit_code = 0
 
-        for file_path in files:
-            try:
-                # Load via library (validates with Pydantic)
-                review = ocr.load(file_path)
-                # Also validate against JSON schema
-                data = review.model_dump(exclude_none=True, mode="json")
-                errors = _validate_schema(data, schema, jsonschema)
-
-                if errors:
-                    click.echo(f"FAIL: {file_path}")
-                    for error in errors:
-                        click.echo(f"  - {error}")
-                    exit_code = 1
-                elif not quiet:
-                    click.echo(f"OK: {file_path}")
-
-            except Exception as e:
-                click.echo(f"FAIL: {file_path}")
-                click.echo(f"  - {e}")
+        validate_file = partial(_validate_file, schema_only=schema_only, fail_fast=quiet)
+        if batch:
+            results = _validate_batch(files, schema_only=schema_only, fail_fast=quiet)
+        elif jobs > 1 and len(files) >= _MIN_PARALLEL_FILES:
+            # Files are independent, so spread them across processes
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+                futures = [executor.submit(validate_file, file_path) for file_path in files]
+                results = [_future_errors(future) for future in futures]
+        else:
+            results = map(validate_file, files)
+
+        for file_path, errors in zip(files, results):
+            if errors:
+                click.echo("\n  - ".join([f"FAIL: {file_path}", *errors]))
                 exit_code = 1
+            elif not quiet:
+                click.echo(f"OK: {file_path}")
 
         sys.exit(exit_code)
 
-    validate()
+    return validate
 
 
 def convert_main():
     """Convert OpenCodeReview files between formats."""
     _require_click()
+    _convert_command()()
+
 
+@lru_cache(maxsize=1)
+def _convert_command():
+    """Build the ocr-convert click command once per process."""
     @click.command()
     @click.argument("input", type=click.Path(exists=True, path_type=Path))
     @click.argument("output", type=click.Path(path_type=Path))
@@ -84,31 +106,235 @@ def convert_main():
             click.echo(f"Error: {e}", err=True)
             sys.exit(1)
 
-    convert()
+    return convert
+
+
+def _validate_file(file_path: Path, schema_only: bool = False, fail_fast: bool = False) -> list[str]:
+    """Validate a single review file. Returns list of errors.
+
+    The file is loaded into the Pydantic model and its normalized data is
+    checked against the JSON schema. With schema_only, YAML/JSON files are
+    checked as written, without building the model. With fail_fast, schema
+    validation stops at the first error.
+    """
+    validator, fast_validate = _get_validators()
+    try:
+        data = _load_for_schema(file_path, schema_only)
+        return _validate_schema(data, validator, fast_validate, fail_fast)
+    except _load_errors() as e:
+        return _format_load_error(e)
+
+
+def _validate_batch(files: list[Path], schema_only: bool = False, fail_fast: bool = False) -> list[list[str]]:
+    """Validate many review files in a single pass of the batch schema.
+
+    Returns the list of errors for each file, in the order of files.
+    """
+    validator, fast_validate = _get_batch_validators()
+    results = [[] for _ in files]
+    docs = []
+    owners = []  # index into files for each entry of docs
+    for index, file_path in enumerate(files):
+        try:
+            data = _load_for_schema(file_path, schema_only)
+        except _load_errors() as e:
+            results[index] = _format_load_error(e)
+            continue
+        docs.append(data)
+        owners.append(index)
+
+    for error in _schema_errors(docs, validator, fast_validate):
+        # Every error lies inside an item; its index identifies the file
+        position, *path = error.path
+        errors = results[owners[position]]
+        if not (fail_fast and errors):
+            errors.append(f"{'.'.join(map(str, path)) or '(root)'}: {error.message}")
+    return results
+
+
+def _load_for_schema(file_path: Path, schema_only: bool):
+    """Load the data of a review file that ocr-validate checks against the schema."""
+    # XML text is untyped, so it always goes through the model
+    if schema_only and file_path.suffix.lower() != ".xml":
+        return ocr.load_raw(file_path)
+    # Load via library (validates with Pydantic) and validate the normalized data
+    return ocr.load(file_path).model_dump(exclude_none=True, mode="json")
+
+
+def _future_errors(future) -> list[str]:
+    """Return the errors of a validation run in a worker process.
+
+    A crashed worker or broken pool fails only the file it was validating.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return [str(e) or type(e).__name__]
 
 
+@lru_cache(maxsize=1)
+def _load_errors() -> tuple[type[Exception], ...]:
+    """Errors that mark a single file as invalid rather than aborting validation.
+
+    Built on first use, so other commands never import yaml or pydantic.
+    """
+    from xml.etree.ElementTree import ParseError
+
+    import yaml
+    from pydantic import ValidationError
+
+    return (ValidationError, OSError, ValueError, yaml.YAMLError, ParseError)
+
+
+def _format_load_error(error: Exception) -> list[str]:
+    """Format a loading or model validation error as a list of messages."""
+    from pydantic import ValidationError
+
+    if isinstance(error, ValidationError):
+        # Skip the documentation URLs and input reprs of the default message
+        return [
+            f"{'.'.join(map(str, e['loc'])) or '(root)'}: {e['msg']}"
+            for e in error.errors(include_url=False, include_input=False)
+        ]
+    return [str(error)]
+
+
+@lru_cache(maxsize=1)
+def _get_validators():
+    """Build the schema validators once per process (including pool workers)."""
+    import jsonschema
+
+    schema = _load_schema()
+    return jsonschema.Draft7Validator(schema), _compile_schema(schema)
+
+
+@lru_cache(maxsize=1)
+def _get_batch_validators():
+    """Build validators for an array of review documents (see _batch_schema)."""
+    import jsonschema
+
+    schema = _batch_schema(_load_schema())
+    return jsonschema.Draft7Validator(schema), _compile_schema(schema, "batch")
+
+
+def _batch_schema(schema: dict) -> dict:
+    """Wrap the review schema so that it validates an array of reviews.
+
+    $defs stays at the root so the schema's "#/$defs/..." references still resolve.
+    """
+    item = {key: value for key, value in schema.items() if key not in ("$schema", "$id", "$defs")}
+    batch = {"type": "array", "items": item}
+    for key in ("$schema", "$defs"):
+        if key in schema:
+            batch[key] = schema[key]
+    return batch
+
+
+@lru_cache(maxsize=1)
 def _load_schema() -> dict:
-    """Load the JSON schema."""
-    pkg_dir = Path(__file__).parent  # cli/
-    schema_paths = [
-        pkg_dir.parent.parent.parent.parent / "schema" / "opencodereview.schema.json",  # repo root
-        pkg_dir.parent / "schema" / "opencodereview.schema.json",  # bundled in package
-    ]
-    for schema_path in schema_paths:
-        if schema_path.exists():
-            with open(schema_path) as f:
-                return json.load(f)
-    raise FileNotFoundError("Could not find opencodereview.schema.json")
-
-
-def _validate_schema(data: dict, schema: dict, jsonschema) -> list[str]:
-    """Validate data against JSON schema. Returns list of errors."""
-    validator = jsonschema.Draft7Validator(schema)
-    errors = []
-    for error in validator.iter_errors(data):
-        path = ".".join(str(p) for p in error.path) if error.path else "(root)"
-        errors.append(f"{path}: {error.message}")
-    return errors
+    """Load the JSON schema.
+
+    The parsed schema is cached for the lifetime of the process; callers
+    must treat the returned dict as read-only.
+    """
+    from importlib import resources
+
+    # Installed packages bundle the schema; dev checkouts read it from the repo root
+    schema = resources.files("opencodereview").joinpath("schema/opencodereview.schema.json")
+    if not schema.is_file():
+        schema = Path(__file__).parents[4] / "schema" / "opencodereview.schema.json"
+        if not schema.is_file():
+            raise FileNotFoundError("Could not find opencodereview.schema.json")
+    raw = schema.read_bytes()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _compile_schema(schema: dict, name: str = "review"):
+    """Compile the schema with fastjsonschema if available. Returns None otherwise.
+
+    The generated validator source is cached on disk, keyed by a hash of the
+    schema, so later runs import it instead of generating it again. Only the
+    latest validator for each name is kept.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    # Match Draft7Validator semantics: formats are annotations only and
+    # validation must never inject defaults into the data.
+    options = {"use_formats": False, "use_default": False}
+    # fastjsonschema resolves references in place; keep the cached schema intact
+    schema = copy.deepcopy(schema)
+
+    key = hashlib.sha256(
+        json.dumps([fastjsonschema.VERSION, options, schema], sort_keys=True).encode()
+    ).hexdigest()[:32]
+    cache_file = _cache_dir() / f"validator_{name}_{key}.py"
+    try:
+        if not cache_file.exists():
+            code = fastjsonschema.compile_to_code(schema, **options)
+            # The first generated function validates the root of the schema
+            entry = re.search(r"^def (\w+)\(", code, re.MULTILINE).group(1)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(f"{code}\n\nvalidate = {entry}\n")
+            os.replace(temp_path, cache_file)
+            _remove_stale_validators(cache_file, name)
+
+        spec = importlib.util.spec_from_file_location(f"_ocr_validator_{name}_{key}", cache_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.validate
+    except (OSError, SyntaxError, ImportError, AttributeError):
+        # Unwritable or corrupt cache: compile in memory instead
+        return fastjsonschema.compile(schema, **options)
+
+
+def _remove_stale_validators(current: Path, name: str) -> None:
+    """Delete validators cached for earlier versions of the schema."""
+    for path in current.parent.glob(f"validator_{name}_*.py"):
+        if path != current:
+            try:
+                path.unlink()
+            except OSError:
+                pass  # another process may still be removing it
+
+
+def _cache_dir() -> Path:
+    """Directory for cached artifacts such as compiled validators."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "opencodereview"
+
+
+def _validate_schema(data: dict, validator, fast_validate=None, fail_fast: bool = False) -> list[str]:
+    """Validate data with a pre-built JSON schema validator. Returns list of errors.
+
+    If a compiled fastjsonschema callable is given, it is used as a fast
+    pass/fail check; jsonschema is only consulted to collect error details.
+    With fail_fast, only the first error is collected.
+    """
+    errors = _schema_errors(data, validator, fast_validate)
+    if fail_fast:
+        errors = islice(errors, 1)
+    return [f"{'.'.join(map(str, error.path)) or '(root)'}: {error.message}" for error in errors]
+
+
+def _schema_errors(data, validator, fast_validate=None):
+    """Yield jsonschema errors for data, skipping the walk if fast_validate accepts it."""
+    if fast_validate is not None:
+        # fast_validate comes from _compile_schema, so fastjsonschema is installed
+        import fastjsonschema
+
+        try:
+            fast_validate(data)
+            return
+        except fastjsonschema.JsonSchemaException:
+            pass
+    yield from validator.iter_errors(data)
 
 
 def _require_rich():
@@ -121,23 +347,49 @@ def _require_rich():
 
 def _get_git_config(key: str) -> str | None:
     """Get git config value."""
+    return _git_config_all().get(key)
+
+
+@lru_cache(maxsize=1)
+def _git_config_all() -> dict[str, str]:
+    """Read the whole git config with a single git call (cached per process)."""
     import subprocess
     try:
         result = subprocess.run(
-            ["git", "config", "--get", key],
+            [_which("git"), "config", "--list", "--null"],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             check=False,
+            close_fds=False,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
     except FileNotFoundError:
-        pass
-    return None
+        return {}
+    if result.returncode != 0:
+        return {}
+    # Entries are "key\nvalue\0"; later entries override earlier ones, as with --get
+    config = {}
+    for entry in result.stdout.split("\0"):
+        if entry:
+            key, _, value = entry.partition("\n")
+            config[key] = value
+    return config
+
+
+def _which(cmd: str) -> str:
+    """Resolve a command to its absolute path, or return it unchanged if not found.
+
+    subprocess only uses posix_spawn() instead of fork()+exec() for an
+    executable with a directory part, and only with close_fds=False.
+    """
+    import shutil
 
+    return shutil.which(cmd) or cmd
 
+
+@lru_cache(maxsize=1)
 def _find_editor() -> str | None:
-    """Find an available editor."""
+    """Find an available editor (cached, so PATH is searched once per session)."""
     import os
     import shutil
 
@@ -164,17 +416,16 @@ def _edit_in_editor(initial: str = "", suffix: str = ".md") -> str | None:
     if not editor:
         return None
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
-        f.write(initial)
-        temp_path = f.name
-
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
     try:
-        result = subprocess.run([editor, temp_path], check=False)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(initial)
+
+        result = subprocess.run([_which(editor), temp_path], check=False, close_fds=False)
         if result.returncode != 0:
             return None
 
-        with open(temp_path) as f:
-            content = f.read()
+        content = Path(temp_path).read_text(encoding="utf-8")
 
         # Strip the initial template marker if unchanged
         return content.strip() if content.strip() != initial.strip() else ""
@@ -219,20 +470,81 @@ def _find_review_files(path: Path) -> list[Path]:
     if path.is_file():
         return [path]
 
+    with os.scandir(path) as entries:
+        return sorted(
+            path / entry.name
+            for entry in entries
+            if entry.name.endswith((".yaml", ".yml", ".json", ".xml")) and entry.is_file()
+        )
+
+
+# Directories skipped when listing files without git
+_IGNORE_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "node_modules", ".tox", ".mypy_cache"})
+
+# Files larger than this are not read for the line preview
+_MAX_PREVIEW_BYTES = 1024 * 1024
+
+# Syntax highlighting language for file extensions in the line preview
+_LANG_MAP = {"py": "python", "js": "javascript", "ts": "typescript", "rb": "ruby", "rs": "rust", "go": "go", "java": "java", "c": "c", "cpp": "cpp", "h": "c", "hpp": "cpp", "md": "markdown", "yaml": "yaml", "yml": "yaml", "json": "json", "xml": "xml", "html": "html", "css": "css", "sh": "bash", "bash": "bash", "zsh": "bash"}
+
+
+def _read_preview_lines(path: Path) -> list[str] | None:
+    """Read a file's lines for the line preview. Returns None if missing, unreadable or too large."""
+    try:
+        if path.stat().st_size > _MAX_PREVIEW_BYTES:
+            return None
+        return path.read_text().split("\n")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _walk_files(root: str, ignore_dirs: frozenset[str]) -> list[str]:
+    """List files below root as relative paths, without descending into ignored directories."""
     files = []
-    for ext in ("*.yaml", "*.yml", "*.json", "*.xml"):
-        files.extend(path.glob(ext))
-    return sorted(files)
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignore_dirs:
+                            pending.append(rel_path)
+                    elif entry.is_file():
+                        files.append(rel_path)
+        except OSError:
+            # Unreadable directory: skip it like rglob does
+            continue
+    return files
+
+
+# Label and style for each issue state and severity in reviews list/show
+_STATE_LABELS = {
+    "resolved": ("✓ resolved", "green"),
+    "retracted": ("✗ retracted", "dim"),
+    "open": ("○ open", "yellow"),
+}
+_SEVERITY_STYLES = {"critical": "red bold", "error": "red", "warning": "yellow"}
 
 
-def _get_issue_state(issue_id: str, activities: list) -> str:
-    """Determine the state of an issue: open, resolved, or retracted."""
+def _build_state_index(activities: list) -> dict[str, str]:
+    """Map addressed activity IDs to their state: resolved or retracted.
+
+    IDs missing from the index are open. The first resolving or retracting
+    activity wins.
+    """
+    states = {}
     for activity in activities:
-        if activity.category == "resolved" and issue_id in activity.addresses:
-            return "resolved"
-        if activity.category == "retract" and issue_id in activity.addresses:
-            return "retracted"
-    return "open"
+        if activity.category == "resolved":
+            state = "resolved"
+        elif activity.category == "retract":
+            state = "retracted"
+        else:
+            continue
+        for issue_id in activity.addresses:
+            states.setdefault(issue_id, state)
+    return states
 
 
 def _format_location(activity) -> str:
@@ -259,7 +571,9 @@ def _format_location(activity) -> str:
 
 def _list_issues(console, path, full, filter_state):
     """List issues from review files."""
+    from rich.console import Group
     from rich.table import Table
+    from rich.text import Text
     from rich.panel import Panel
     from rich.markdown import Markdown
 
@@ -282,9 +596,10 @@ def _list_issues(console, path, full, filter_state):
             continue
 
         # Filter issues by state
+        states = _build_state_index(review.activities)
         filtered_issues = []
         for issue in issues:
-            state = _get_issue_state(issue.id, review.activities)
+            state = states.get(issue.id, "open")
             if filter_state == "all" or state == filter_state:
                 filtered_issues.append((issue, state))
 
@@ -303,24 +618,10 @@ def _list_issues(console, path, full, filter_state):
             table.add_column("Summary", style="white", overflow="ellipsis", max_width=50)
 
         for issue, state in filtered_issues:
-            # State formatting
-            if state == "resolved":
-                state_str = "[green]✓ resolved[/green]"
-            elif state == "retracted":
-                state_str = "[dim]✗ retracted[/dim]"
-            else:
-                state_str = "[yellow]○ open[/yellow]"
-
-            # Severity formatting
+            # Styled cells are built directly, skipping rich's markup parser
+            state_str = Text.assemble(_STATE_LABELS[state])
             severity = issue.severity or "info"
-            if severity == "critical":
-                severity_str = f"[red bold]{severity}[/red bold]"
-            elif severity == "error":
-                severity_str = f"[red]{severity}[/red]"
-            elif severity == "warning":
-                severity_str = f"[yellow]{severity}[/yellow]"
-            else:
-                severity_str = f"[dim]{severity}[/dim]"
+            severity_str = Text.assemble((severity, _SEVERITY_STYLES.get(severity, "dim")))
 
             location = _format_location(issue)
 
@@ -345,16 +646,19 @@ def _list_issues(console, path, full, filter_state):
 
         console.print(table)
 
-        # If --full, print content below table
+        # If --full, print content below table (in one call, so it renders in one pass)
         if full:
+            panels = []
             for issue, state in filtered_issues:
                 if issue.content:
-                    console.print()
-                    console.print(Panel(
+                    panels.append("")
+                    panels.append(Panel(
                         Markdown(issue.content),
                         title=f"[cyan]{issue.id}[/cyan]",
                         border_style="dim"
                     ))
+            if panels:
+                console.print(Group(*panels))
 
         console.print()
 
@@ -388,8 +692,9 @@ def _show_review(console, file, conversation_id):
         console.print(f"[red]Error loading {file}: {e}[/red]")
         sys.exit(1)
 
-    # Build activity lookup by ID
+    # Build activity lookup by ID and issue states
     activity_by_id = {a.id: a for a in review.activities}
+    states = _build_state_index(review.activities)
 
     # Review header
     console.print(Panel(f"[bold]{file}[/bold]", style="blue"))
@@ -409,13 +714,14 @@ def _show_review(console, file, conversation_id):
 
     # Status and reviewers
     console.print(f"[bold]Status:[/bold] {review.status}")
-    if review.reviewers:
-        console.print(f"[bold]Reviewers:[/bold] {', '.join(review.reviewers)}")
+    reviewers = review.reviewers
+    if reviewers:
+        console.print(f"[bold]Reviewers:[/bold] {', '.join(reviewers)}")
     console.print()
 
     # Activity summary (use visible activities for count)
     visible = review.get_visible_activities()
-    categories = Counter(a.category for a in visible)
+    categories = Counter([a.category for a in visible])
     summary_parts = [f"{cat}: {count}" for cat, count in sorted(categories.items())]
     console.print(f"[bold]Activities:[/bold] {', '.join(summary_parts)}")
     console.print()
@@ -456,16 +762,10 @@ def _show_review(console, file, conversation_id):
 
             # Category color and state for issues
             cat = activity.category
-            state_str = ""
+            state_label = None
             if cat == "issue":
                 cat_style = "red"
-                state = _get_issue_state(activity.id, review.activities)
-                if state == "resolved":
-                    state_str = " [green]✓ resolved[/green]"
-                elif state == "retracted":
-                    state_str = " [dim]✗ retracted[/dim]"
-                else:
-                    state_str = " [yellow]○ open[/yellow]"
+                state_label = _STATE_LABELS[states.get(activity.id, "open")]
             elif cat == "resolved":
                 cat_style = "green"
             elif cat == "retract":
@@ -483,8 +783,9 @@ def _show_review(console, file, conversation_id):
             header = Text()
             header.append(f"[{activity.id}] ", style="dim")
             header.append(cat, style=cat_style)
-            if state_str:
-                header.append_text(Text.from_markup(state_str))
+            if state_label:
+                header.append(" ")
+                header.append(*state_label)
             header.append(" by ")
             header.append(author_name)
             if author_meta:
@@ -528,9 +829,12 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
     from beaupy import select, prompt, confirm
     from rich.panel import Panel
     from rich.markdown import Markdown
+    from rich.syntax import Syntax
     from datetime import datetime, timezone
 
-    from opencodereview.models import Review, Subject, Author
+    from pydantic import TypeAdapter
+
+    from opencodereview.models import Activity, Review, Subject, Author
 
     # Load or create review
     if file_path.exists():
@@ -711,30 +1015,28 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
             # Get list of tracked files from git (respects .gitignore)
             try:
                 git_result = subprocess.run(
-                    ["git", "ls-files"],
+                    [_which("git"), "ls-files"],
+                    stdin=subprocess.DEVNULL,
                     capture_output=True,
                     text=True,
                     check=True,
+                    close_fds=False,
                 )
                 files = git_result.stdout.strip().split("\n") if git_result.stdout.strip() else []
             except (subprocess.CalledProcessError, FileNotFoundError):
                 # Fallback: list files excluding common ignore patterns
-                from pathlib import Path
-                ignore_dirs = {".git", ".venv", "venv", "__pycache__", "node_modules", ".tox", ".mypy_cache"}
-                files = sorted(
-                    str(p.relative_to(Path.cwd()))
-                    for p in Path.cwd().rglob("*")
-                    if p.is_file() and not any(part in ignore_dirs for part in p.parts)
-                )
+                files = sorted(_walk_files(".", _IGNORE_DIRS))
 
             if files:
                 # Try fzf first (best experience), fall back to beaupy select
-                if shutil.which("fzf"):
+                fzf = shutil.which("fzf")
+                if fzf:
                     result = subprocess.run(
-                        ["fzf", "--height=40%", "--reverse"],
+                        [fzf, "--height=40%", "--reverse"],
                         input="\n".join(files),
                         capture_output=True,
                         text=True,
+                        close_fds=False,
                     )
                     if result.returncode == 0 and result.stdout.strip():
                         file_loc = result.stdout.strip()
@@ -749,11 +1051,9 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
             file_loc = (prompt("File path: ") or "").strip()
 
         if file_loc:
-            from rich.syntax import Syntax
-            from rich.panel import Panel
-            from pathlib import Path
-
             file_path_obj = Path(file_loc)
+            # Read once for all preview attempts; None if missing or too large
+            file_lines = _read_preview_lines(file_path_obj)
 
             while True:
                 lines_str = (prompt("Lines (e.g., 5 or 1,3-10,15): ") or "").strip()
@@ -773,16 +1073,12 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
                             lines_loc.append((line_num, line_num))
 
                     # Show syntax-highlighted preview and confirm
-                    if lines_loc and file_path_obj.exists():
+                    if lines_loc and file_lines is not None:
                         # Collect all line numbers to show
                         all_lines = set()
                         for start, end in lines_loc:
                             all_lines.update(range(start, end + 1))
 
-                        # Read file and extract lines
-                        content = file_path_obj.read_text()
-                        file_lines = content.split("\n")
-
                         # Build preview with just selected lines
                         preview_lines = []
                         for line_num in sorted(all_lines):
@@ -792,8 +1088,7 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
                         if preview_lines:
                             # Detect language from extension
                             ext = file_path_obj.suffix.lstrip(".")
-                            lang_map = {"py": "python", "js": "javascript", "ts": "typescript", "rb": "ruby", "rs": "rust", "go": "go", "java": "java", "c": "c", "cpp": "cpp", "h": "c", "hpp": "cpp", "md": "markdown", "yaml": "yaml", "yml": "yaml", "json": "json", "xml": "xml", "html": "html", "css": "css", "sh": "bash", "bash": "bash", "zsh": "bash"}
-                            lang = lang_map.get(ext, ext) or "text"
+                            lang = _LANG_MAP.get(ext, ext) or "text"
 
                             # Show with syntax highlighting
                             preview_text = "\n".join(preview_lines)
@@ -812,7 +1107,7 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
                         else:
                             console.print("[yellow]No valid lines in range[/yellow]")
                     else:
-                        break  # File doesn't exist or no lines, just accept input
+                        break  # No preview (missing or large file) or no lines, just accept input
 
                 except ValueError:
                     console.print("[yellow]Invalid line format, try again[/yellow]")
@@ -854,15 +1149,11 @@ def _add_activity(console, file_path: Path, addressing_id: str | None):
     if severity:
         activity_data["severity"] = severity
 
-    # Add activity to review
-    # We need to serialize and re-parse to get proper Activity type
-    review_data = review.model_dump(exclude_none=True, mode="json")
-    review_data["activities"].append(activity_data)
-
-    # Save
+    # Add activity to review and save. Only the new activity is validated
+    # (resolving its type by category); existing ones are already valid.
     try:
-        updated_review = Review.model_validate(review_data)
-        ocr.dump(updated_review, file_path)
+        review.activities.append(TypeAdapter(Activity).validate_python(activity_data))
+        ocr.dump(review, file_path)
         console.print()
         console.print(f"[green]Added activity [{activity_id}] to {file_path}[/green]")
     except Exception as e:
@@ -874,7 +1165,12 @@ def reviews_main():
     """List and display issues from OpenCodeReview files."""
     _require_click()
     _require_rich()
+    _reviews_command()()
+
 
+@lru_cache(maxsize=1)
+def _reviews_command():
+    """Build the reviews click command once per process."""
     from rich.console import Console
 
     @click.group()
@@ -929,5 +1225,5 @@ def reviews_main():
         """
         _add_activity(ctx.obj["console"], file, activity_id)
 
-    reviews()
+    return reviews
 
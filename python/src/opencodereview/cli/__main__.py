@@ -2,30 +2,33 @@
 
 import sys
 
+# Command name -> entry point in opencodereview.cli
+_COMMANDS = {
+    "validate": "validate_main",
+    "convert": "convert_main",
+    "reviews": "reviews_main",
+}
+
 
 def main():
     if len(sys.argv) < 2:
         print("Usage: python -m opencodereview.cli <command> [args...]")
-        print("Commands: validate, convert, reviews")
+        print(f"Commands: {', '.join(_COMMANDS)}")
         sys.exit(1)
 
     command = sys.argv[1]
-    sys.argv = sys.argv[1:]  # Shift argv so click sees correct args
-
-    if command == "validate":
-        from . import validate_main
-        validate_main()
-    elif command == "convert":
-        from . import convert_main
-        convert_main()
-    elif command == "reviews":
-        from . import reviews_main
-        reviews_main()
-    else:
+    entry_point = _COMMANDS.get(command)
+    if entry_point is None:
         print(f"Unknown command: {command}")
-        print("Commands: validate, convert, reviews")
+        print(f"Commands: {', '.join(_COMMANDS)}")
         sys.exit(1)
 
+    sys.argv = sys.argv[1:]  # Shift argv so click sees correct args
+
+    from opencodereview import cli
+
+    getattr(cli, entry_point)()
+
 
 if __name__ == "__main__":
     main()
@@ -1,15 +1,44 @@
 """I/O functions for loading and saving OpenCodeReview files."""
 
+import io
 import json
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TextIO
+from typing import IO, Any, TextIO
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 from .models import Review
 
+# Prefer the libyaml-backed loader and dumper; fall back to pure Python when
+# PyYAML was built without it.
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+
+# SafeLoader that leaves timestamps as plain strings (JSON-compatible). Built
+# with type() so it stays a regular Python class when io.py is mypyc-compiled;
+# a compiled subclass of the C loader crashes on instantiation.
+_RawYamlLoader: Any = type("_RawYamlLoader", (_SafeLoader,), {})
+_RawYamlLoader.add_constructor("tag:yaml.org,2002:timestamp", _RawYamlLoader.construct_yaml_str)
+
 
 # Elements whose text content should be wrapped in CDATA if it contains special chars
 CDATA_ELEMENTS = {"content", "instructions", "diff", "context"}
@@ -17,7 +46,7 @@ CDATA_ELEMENTS = {"content", "instructions", "diff", "context"}
 
 def _exclude_empty(data: dict) -> dict:
     """Recursively remove None values and empty lists/dicts to minimize output size."""
-    result = {}
+    result: dict = {}
     for key, value in data.items():
         if value is None:
             continue
@@ -44,28 +73,63 @@ def load(source: str | Path | TextIO, format: str | None = None) -> Review:
     Returns:
         Review object
     """
+    with _open_source(source, format) as (f, format):
+        if format == "json":
+            # pydantic-core parses JSON itself, without building Python dicts first
+            return Review.model_validate_json(f.read())
+        return Review.model_validate(_parse_stream(f, format, _SafeLoader))
+
+
+def load_raw(source: str | Path | TextIO, format: str | None = None) -> dict:
+    """Load a review file as plain data, without model validation.
+
+    YAML timestamps are kept as strings, so YAML and JSON files give the same
+    JSON-compatible data. XML values are untyped strings.
+
+    Args:
+        source: File path or file-like object
+        format: Format to use ('yaml', 'json', 'xml'). Auto-detected from extension if not specified.
+
+    Returns:
+        Parsed data
+    """
+    with _open_source(source, format) as (f, format):
+        return _parse_stream(f, format, _RawYamlLoader)
+
+
+@contextmanager
+def _open_source(source: str | Path | TextIO, format: str | None) -> Iterator[tuple[IO, str]]:
+    """Open a file path (or pass through a file-like object) and resolve its format.
+
+    Paths are opened in binary mode: every parser accepts bytes and handles
+    the encoding itself. Parsers read from the open file, so the whole text
+    is never held in memory next to the parsed tree.
+    """
     if isinstance(source, (str, Path)):
         path = Path(source)
         if format is None:
             format = _detect_format(path)
-        with open(path) as f:
-            content = f.read()
-    else:
-        content = source.read()
-        if format is None:
-            raise ValueError("format must be specified when loading from file-like object")
+        with open(path, "rb") as f:
+            yield f, format
+        return
+    if format is None:
+        raise ValueError("format must be specified when loading from file-like object")
+    yield source, format
 
+
+def _parse_stream(f: IO, format: str, yaml_loader: type) -> dict:
+    """Parse an open file in the given format."""
     if format == "yaml":
-        data = yaml.safe_load(content)
+        return yaml.load(f, Loader=yaml_loader)
     elif format == "json":
-        data = json.loads(content)
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
     elif format == "xml":
-        data = _parse_xml(content)
+        return _parse_xml(f)
     else:
         raise ValueError(f"Unsupported format: {format}")
 
-    return Review.model_validate(data)
-
 
 def dump(review: Review, dest: str | Path | TextIO, format: str | None = None) -> None:
     """Save a review to a file or file-like object.
@@ -82,12 +146,20 @@ def dump(review: Review, dest: str | Path | TextIO, format: str | None = None) -
         path = Path(dest)
         if format is None:
             format = _detect_format(path)
-        with open(path, "w") as f:
-            _write_format(f, data, format)
+        # Serialize before opening the file, so a failure leaves it untouched
+        if format == "json":
+            # JSON is serialized to UTF-8 bytes; write them without decoding
+            content = _to_json(data)
+            with open(path, "wb") as f:
+                f.write(content)
+        else:
+            text = _serialize(data, format)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
     else:
         if format is None:
             raise ValueError("format must be specified when saving to file-like object")
-        _write_format(dest, data, format)
+        dest.write(_serialize(data, format))
 
 
 def _detect_format(path: Path) -> str:
@@ -104,27 +176,59 @@ def _detect_format(path: Path) -> str:
         return "yaml"
 
 
-def _write_format(f: TextIO, data: dict, format: str) -> None:
-    """Write data in specified format."""
+def _serialize(data: dict, format: str) -> str:
+    """Serialize data in specified format."""
     if format == "yaml":
-        yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
     elif format == "json":
-        json.dump(data, f, indent=2, default=str)
+        return _to_json(data).decode()
     elif format == "xml":
-        xml_str = _to_xml(data)
-        f.write(xml_str)
+        return _to_xml(data)
     else:
         raise ValueError(f"Unsupported format for writing: {format}")
 
 
+def _to_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, encoded as UTF-8."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+        except TypeError:
+            # orjson cannot write integers beyond 64 bits; the standard
+            # library writes any value it accepts
+            pass
+    # Like orjson, write non-ASCII text as is rather than as \u escapes
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode()
+
+
 # =============================================================================
 # XML Parsing
 # =============================================================================
 
 
-def _parse_xml(content: str) -> dict:
-    """Parse XML content into a dict."""
-    root = ET.fromstring(content)
+def _parse_xml(f: IO) -> dict:
+    """Parse an XML file into a dict.
+
+    Binary files are parsed with lxml when it is installed. lxml rejects
+    text input that carries an encoding declaration, so text streams always
+    use the standard library parser.
+    """
+    if lxml_etree is not None and not isinstance(f, io.TextIOBase):
+        # Match expat: expand internal entities but never read external ones,
+        # and accept text nodes of any size
+        parser = lxml_etree.XMLParser(
+            resolve_entities="internal",
+            no_network=True,
+            huge_tree=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        try:
+            root = lxml_etree.parse(f, parser).getroot()
+        except lxml_etree.XMLSyntaxError as e:
+            raise ET.ParseError(str(e)) from e
+    else:
+        root = ET.parse(f).getroot()
     return _xml_element_to_dict(root)
 
 
@@ -135,51 +239,49 @@ def _xml_element_to_dict(elem: ET.Element) -> dict:
     for child in elem:
         tag = child.tag
 
-        # Handle special array elements
-        if tag == "activities":
-            result["activities"] = [_xml_element_to_dict(a) for a in child.findall("activity")]
-        elif tag == "replies":
-            result["replies"] = [_xml_element_to_dict(a) for a in child.findall("activity")]
-        elif tag == "lines":
-            result["lines"] = _parse_lines(child)
-        elif tag == "mentions":
-            result["mentions"] = [m.text for m in child.findall("mention") if m.text]
-        elif tag == "supersedes":
-            result["supersedes"] = [i.text for i in child.findall("id") if i.text]
-        elif tag == "addresses":
-            result["addresses"] = [i.text for i in child.findall("id") if i.text]
-        elif tag == "conditions":
-            result["conditions"] = [c.text for c in child.findall("condition") if c.text]
-        elif tag == "scope":
-            result["scope"] = [p.text for p in child.findall("pattern") if p.text]
-        elif tag in ("author", "location", "selector", "subject", "agent_context"):
-            result[tag] = _xml_element_to_dict(child)
-        else:
+        # Arrays and nested objects have their own readers
+        reader = _XML_READERS.get(tag)
+        if reader is not None:
+            result[tag] = reader(child)
+        elif child.text and child.text.strip():
             # Simple text element
-            if child.text and child.text.strip():
-                # Strip leading/trailing whitespace but preserve internal structure
-                value = child.text.strip()
-                # Only convert booleans for known boolean fields
-                # (not for content/context/instructions which are string fields)
-                if tag in ("deleted", "auto_respond", "require_mention"):
-                    if value.lower() == "true":
-                        result[tag] = True
-                        continue
-                    elif value.lower() == "false":
-                        result[tag] = False
-                        continue
-                # Preserve trailing newline if original had one (for multiline content)
-                if child.text.rstrip(" \t").endswith("\n"):
-                    value = value + "\n"
-                result[tag] = value
+            # Strip leading/trailing whitespace but preserve internal structure
+            value = child.text.strip()
+            # Only convert booleans for known boolean fields
+            # (not for content/context/instructions which are string fields)
+            if tag in ("deleted", "auto_respond", "require_mention"):
+                if value.lower() == "true":
+                    result[tag] = True
+                    continue
+                elif value.lower() == "false":
+                    result[tag] = False
+                    continue
+            # Preserve trailing newline if original had one (for multiline content)
+            if child.text.rstrip(" \t").endswith("\n"):
+                value = value + "\n"
+            result[tag] = value
 
     return result
 
 
+def _read_activities(elem: ET.Element) -> list[dict]:
+    """Read the <activity> children of an activities or replies element."""
+    return [_xml_element_to_dict(a) for a in elem.iterfind("activity")]
+
+
+def _read_texts(item_tag: str) -> Callable[[ET.Element], list[str]]:
+    """Make a reader for a list of non-empty <item_tag> text children."""
+
+    def read(elem: ET.Element) -> list[str]:
+        return [item.text for item in elem.iterfind(item_tag) if item.text]
+
+    return read
+
+
 def _parse_lines(lines_elem: ET.Element) -> list:
     """Parse lines element into list of [start, end] tuples."""
     result = []
-    for range_elem in lines_elem.findall("range"):
+    for range_elem in lines_elem.iterfind("range"):
         start = range_elem.find("start")
         end = range_elem.find("end")
         if start is not None and end is not None and start.text and end.text:
@@ -187,6 +289,24 @@ def _parse_lines(lines_elem: ET.Element) -> list:
     return result
 
 
+# Reader for each element that is not a simple text value, keyed by tag
+_XML_READERS: dict[str, Callable[[ET.Element], object]] = {
+    "activities": _read_activities,
+    "replies": _read_activities,
+    "lines": _parse_lines,
+    "mentions": _read_texts("mention"),
+    "supersedes": _read_texts("id"),
+    "addresses": _read_texts("id"),
+    "conditions": _read_texts("condition"),
+    "scope": _read_texts("pattern"),
+    "author": _xml_element_to_dict,
+    "location": _xml_element_to_dict,
+    "selector": _xml_element_to_dict,
+    "subject": _xml_element_to_dict,
+    "agent_context": _xml_element_to_dict,
+}
+
+
 # =============================================================================
 # XML Writing
 # =============================================================================
@@ -207,8 +327,9 @@ def _wrap_cdata(xml_str: str) -> str:
         unescaped = (
             content.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
         )
-        # Only use CDATA if content had special chars (i.e., was escaped)
-        if unescaped != content:
+        # Only use CDATA if content had special chars (i.e., was escaped).
+        # CDATA cannot hold carriage returns, which parsers turn into newlines.
+        if unescaped != content and "&#13;" not in content:
             return f"<{tag}><![CDATA[{unescaped}]]></{tag}>"
         return match.group(0)  # No change needed
 
@@ -229,74 +350,90 @@ def _to_xml(data: dict) -> str:
     xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(
         root, encoding="unicode"
     )
+    # Parsers normalize a literal carriage return to a newline; keep it as a
+    # character reference so it round-trips
+    xml_str = xml_str.replace("\r", "&#13;")
     return _wrap_cdata(xml_str)
 
 
 def _dict_to_xml(data: dict, parent: ET.Element) -> None:
-    """Convert a dict to XML elements under parent."""
-    for key, value in data.items():
-        if value is None:
-            continue
+    """Convert a dict to XML elements under parent.
 
-        if key == "activities":
-            activities_elem = ET.SubElement(parent, "activities")
-            for activity in value:
-                activity_elem = ET.SubElement(activities_elem, "activity")
-                _dict_to_xml(activity, activity_elem)
-        elif key == "replies":
-            replies_elem = ET.SubElement(parent, "replies")
-            for reply in value:
-                reply_elem = ET.SubElement(replies_elem, "activity")
-                _dict_to_xml(reply, reply_elem)
-        elif key == "lines":
-            lines_elem = ET.SubElement(parent, "lines")
-            for line_range in value:
-                range_elem = ET.SubElement(lines_elem, "range")
-                start = ET.SubElement(range_elem, "start")
-                start.text = str(line_range[0])
-                end = ET.SubElement(range_elem, "end")
-                end.text = str(line_range[1])
-        elif key == "mentions":
-            mentions_elem = ET.SubElement(parent, "mentions")
-            for mention in value:
-                m = ET.SubElement(mentions_elem, "mention")
-                m.text = mention
-        elif key == "supersedes":
-            supersedes_elem = ET.SubElement(parent, "supersedes")
-            for id_val in value:
-                i = ET.SubElement(supersedes_elem, "id")
-                i.text = id_val
-        elif key == "addresses":
-            addresses_elem = ET.SubElement(parent, "addresses")
-            for id_val in value:
-                i = ET.SubElement(addresses_elem, "id")
-                i.text = id_val
-        elif key == "conditions":
-            conditions_elem = ET.SubElement(parent, "conditions")
-            for cond in value:
-                c = ET.SubElement(conditions_elem, "condition")
-                c.text = cond
-        elif key == "scope":
-            scope_elem = ET.SubElement(parent, "scope")
-            for pattern in value:
-                p = ET.SubElement(scope_elem, "pattern")
-                p.text = pattern
-        elif key in ("author", "location", "selector", "subject", "agent_context"):
-            child_elem = ET.SubElement(parent, key)
-            _dict_to_xml(value, child_elem)
-        elif isinstance(value, dict):
-            child_elem = ET.SubElement(parent, key)
-            _dict_to_xml(value, child_elem)
-        elif isinstance(value, list):
-            # Generic list handling
-            list_elem = ET.SubElement(parent, key)
-            for item in value:
-                if isinstance(item, dict):
-                    item_elem = ET.SubElement(list_elem, "item")
-                    _dict_to_xml(item, item_elem)
-                else:
+    Nested dicts are queued on an explicit stack instead of being written
+    recursively. Elements are still created in order, so only the point at
+    which their content is filled in changes.
+    """
+    pending = [(data, parent)]
+    while pending:
+        data, parent = pending.pop()
+        for key, value in data.items():
+            if value is None:
+                continue
+
+            writer = _XML_WRITERS.get(key)
+            if writer is not None:
+                pending.extend(writer(parent, key, value))
+            elif isinstance(value, dict):
+                pending.append((value, ET.SubElement(parent, key)))
+            elif isinstance(value, list):
+                # Generic list handling
+                list_elem = ET.SubElement(parent, key)
+                for item in value:
                     item_elem = ET.SubElement(list_elem, "item")
-                    item_elem.text = str(item)
-        else:
-            elem = ET.SubElement(parent, key)
-            elem.text = str(value)
+                    if isinstance(item, dict):
+                        pending.append((item, item_elem))
+                    else:
+                        item_elem.text = str(item)
+            else:
+                elem = ET.SubElement(parent, key)
+                elem.text = str(value)
+
+
+# Writers create the element for a key and return the (dict, element) pairs
+# still to be written by _dict_to_xml.
+_WorkItems = list[tuple[dict, ET.Element]]
+
+
+def _write_activities(parent: ET.Element, key: str, activities: list[dict]) -> _WorkItems:
+    """Write activities or replies as <activity> children of a <key> element."""
+    list_elem = ET.SubElement(parent, key)
+    return [(activity, ET.SubElement(list_elem, "activity")) for activity in activities]
+
+
+def _write_lines(parent: ET.Element, key: str, lines: list) -> _WorkItems:
+    """Write line ranges as <range> elements with <start> and <end>."""
+    lines_elem = ET.SubElement(parent, key)
+    for line_range in lines:
+        range_elem = ET.SubElement(lines_elem, "range")
+        start = ET.SubElement(range_elem, "start")
+        start.text = str(line_range[0])
+        end = ET.SubElement(range_elem, "end")
+        end.text = str(line_range[1])
+    return []
+
+
+def _write_texts(item_tag: str) -> Callable[[ET.Element, str, list[str]], _WorkItems]:
+    """Make a writer for a list of strings as <item_tag> children."""
+
+    def write(parent: ET.Element, key: str, values: list[str]) -> _WorkItems:
+        list_elem = ET.SubElement(parent, key)
+        for value in values:
+            item = ET.SubElement(list_elem, item_tag)
+            item.text = value
+        return []
+
+    return write
+
+
+# Writer for each key that needs more than a plain element, keyed by name.
+# Other dicts become nested elements, other lists <item> children.
+_XML_WRITERS: dict[str, Callable[..., _WorkItems]] = {
+    "activities": _write_activities,
+    "replies": _write_activities,
+    "lines": _write_lines,
+    "mentions": _write_texts("mention"),
+    "supersedes": _write_texts("id"),
+    "addresses": _write_texts("id"),
+    "conditions": _write_texts("condition"),
+    "scope": _write_texts("pattern"),
+}
@@ -140,6 +140,22 @@ Activity = Annotated[
     Field(discriminator="category"),
 ]
 
+# ActivityBase.replies refers to Activity, which only exists now. Resolve it
+# so the activity models are built once at import, not lazily on first use.
+for _model in (
+    ActivityBase,
+    Comment,
+    ReviewMark,
+    Resolution,
+    Retraction,
+    Mention,
+    Assignment,
+    StatusChange,
+    Verdict,
+):
+    _model.model_rebuild()
+del _model
+
 
 class Subject(BaseModel):
     """What's being reviewed."""
@@ -198,22 +214,19 @@ class Review(BaseModel):
 
     @property
     def reviewers(self) -> list[str]:
-        """Collect reviewers from assigned activities."""
+        """Collect reviewers from assigned activities, in order of first mention."""
         reviewers = []
         for activity in self.activities:
             if activity.category == "assigned":
                 reviewers.extend(activity.mentions)
-        return list(set(reviewers))
+        return list(dict.fromkeys(reviewers))
 
     def get_visible_activities(self) -> list[Activity]:
         """Get activities that are not superseded or retracted."""
-        superseded = set()
-        retracted = set()
-
+        hidden: set[str] = set()
         for activity in self.activities:
-            superseded.update(activity.supersedes)
+            hidden.update(activity.supersedes)
             if activity.category == "retract":
-                retracted.update(activity.addresses)
+                hidden.update(activity.addresses)
 
-        hidden = superseded | retracted
         return [a for a in self.activities if a.id not in hidden]
@@ -1,8 +1,36 @@
 """Pytest configuration."""
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+from hypothesis import HealthCheck, settings
+
 # Add src to path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+# Hypothesis profiles, selected with HYPOTHESIS_PROFILE (default "dev"). Tests
+# set their own max_examples; profiles only tune timing and reproducibility.
+# Generated reviews are large, so slow generation on a loaded or single-core
+# machine is not treated as a failure.
+settings.register_profile(
+    "dev",
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "ci",
+    deadline=None,
+    derandomize=True,
+    print_blob=True,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep cached artifacts such as compiled validators out of ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
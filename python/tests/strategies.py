@@ -1,5 +1,8 @@
 """Hypothesis strategies for OpenCodeReview models."""
 
+from datetime import datetime, timezone
+from functools import cache
+
 from hypothesis import strategies as st
 
 from opencodereview import (
@@ -24,6 +27,52 @@ from opencodereview import (
 # Primitive Strategies
 # =============================================================================
 
+# Free text: any characters except lone surrogates. Built once and shared, as
+# constructing the alphabet is costly.
+_TEXT_ALPHABET = st.characters(blacklist_categories=("Cs",))
+
+# Free text that survives an XML round trip: only characters XML 1.0 can hold,
+# and no empty strings or leading/trailing whitespace, which XML text does not
+# preserve. Strategies taking xml_safe pick their text from these.
+_XML_TEXT_ALPHABET = st.characters(
+    blacklist_categories=("Cs",),
+    blacklist_characters=[chr(c) for c in range(0x20) if c not in (0x9, 0xA, 0xD)]
+    + ["\ufffe", "\uffff"],
+)
+
+
+def _xml_text(max_size):
+    text = st.text(min_size=1, max_size=max_size, alphabet=_XML_TEXT_ALPHABET)
+    return text.map(str.strip).filter(bool)
+
+
+# Text strategies keyed by xml_safe
+_CONTENT_TEXT = {
+    False: st.text(min_size=1, max_size=500, alphabet=_TEXT_ALPHABET),
+    True: _xml_text(500),
+}
+_OPTIONAL_SHORT_TEXT = {
+    False: st.none() | st.text(max_size=200, alphabet=_TEXT_ALPHABET),
+    True: st.none() | _xml_text(200),
+}
+_LONG_TEXT = {
+    False: st.text(max_size=1000, alphabet=_TEXT_ALPHABET),
+    True: _xml_text(1000),
+}
+_METADATA_TEXT = {
+    False: st.text(max_size=50),
+    True: _xml_text(50),
+}
+
+# Git object hashes: full 40 hex characters and the 7-character short form.
+# Drawn as bytes, which is cheaper than picking each hex character.
+_SHA = st.binary(min_size=20, max_size=20).map(bytes.hex)
+_SHORT_SHA = st.binary(min_size=4, max_size=4).map(lambda b: b.hex()[:7])
+_OPTIONAL_SHA = st.none() | _SHA
+
+
+_ID_PREFIXES = st.sampled_from(["c", "r", "a", "v", "m", "comment", "review"])
+
 
 @st.composite
 def ids(draw):
@@ -36,51 +85,56 @@ def ids(draw):
         return str(uuid.uuid4())
     else:
         # Short readable ID like "c1", "review-1", "comment-abc"
-        prefix = draw(st.sampled_from(["c", "r", "a", "v", "m", "comment", "review"]))
+        prefix = draw(_ID_PREFIXES)
         suffix = draw(st.integers(min_value=1, max_value=9999))
         return f"{prefix}{suffix}"
 
 
+_PERSON_NAMES = st.sampled_from(["alice", "bob", "charlie", "jane", "john"])
+_TEAM_NAMES = st.sampled_from(["security-team", "reviewers", "maintainers", "qa"])
+_SPECIAL_MENTIONS = st.sampled_from(["@agent", "@human", "@claude", "@gpt4"])
+
+
 @st.composite
 def mentions(draw):
     """Generate @-mentions like "@alice", "@agent", "@security-team"."""
     kind = draw(st.integers(min_value=0, max_value=2))
     if kind == 0:
         # Person mention
-        name = draw(st.sampled_from(["alice", "bob", "charlie", "jane", "john"]))
+        name = draw(_PERSON_NAMES)
         return f"@{name}"
     elif kind == 1:
         # Role/team mention
-        team = draw(st.sampled_from(["security-team", "reviewers", "maintainers", "qa"]))
+        team = draw(_TEAM_NAMES)
         return f"@{team}"
     else:
         # Special mention
-        return draw(st.sampled_from(["@agent", "@human", "@claude", "@gpt4"]))
+        return draw(_SPECIAL_MENTIONS)
+
+
+_DIR_LISTS = st.lists(
+    st.sampled_from(["src", "lib", "tests", "pkg", "internal", "api", "core"]),
+    min_size=0,
+    max_size=3,
+)
+_FILENAMES = st.sampled_from(
+    [
+        "main.py",
+        "utils.py",
+        "handler.go",
+        "index.ts",
+        "app.rs",
+        "config.yaml",
+        "README.md",
+    ]
+)
 
 
 @st.composite
 def file_paths(draw):
     """Generate valid file paths like "src/main.py"."""
-    dirs = draw(
-        st.lists(
-            st.sampled_from(["src", "lib", "tests", "pkg", "internal", "api", "core"]),
-            min_size=0,
-            max_size=3,
-        )
-    )
-    filename = draw(
-        st.sampled_from(
-            [
-                "main.py",
-                "utils.py",
-                "handler.go",
-                "index.ts",
-                "app.rs",
-                "config.yaml",
-                "README.md",
-            ]
-        )
-    )
+    dirs = draw(_DIR_LISTS)
+    filename = draw(_FILENAMES)
     if dirs:
         return "/".join(dirs) + "/" + filename
     return filename
@@ -99,20 +153,28 @@ def line_ranges(draw):
 # =============================================================================
 
 
+_HUMAN_NAMES = st.sampled_from(["Alice", "Bob", "Charlie", "Jane", "John", "Eve"])
+
+
 @st.composite
 def human_authors(draw):
     """Generate human authors with name and optional email."""
-    name = draw(st.sampled_from(["Alice", "Bob", "Charlie", "Jane", "John", "Eve"]))
+    name = draw(_HUMAN_NAMES)
     email = draw(st.none() | st.just(f"{name.lower()}@example.com"))
     return Author(name=name, email=email)
 
 
+_AGENT_NAMES = st.sampled_from(["Claude", "GPT-4", "Copilot", "CodeReviewer"])
+_OPTIONAL_AGENT_MODEL = st.none() | st.sampled_from(["opus", "sonnet", "haiku", "gpt-4o"])
+_OPTIONAL_AGENT_VERSION = st.none() | st.sampled_from(["4.5", "3.5", "1.0"])
+
+
 @st.composite
 def agent_authors(draw):
     """Generate AI agent authors."""
-    name = draw(st.sampled_from(["Claude", "GPT-4", "Copilot", "CodeReviewer"]))
-    model = draw(st.none() | st.sampled_from(["opus", "sonnet", "haiku", "gpt-4o"]))
-    version = draw(st.none() | st.sampled_from(["4.5", "3.5", "1.0"]))
+    name = draw(_AGENT_NAMES)
+    model = draw(_OPTIONAL_AGENT_MODEL)
+    version = draw(_OPTIONAL_AGENT_VERSION)
     return Author(type="agent", name=name, model=model, version=version)
 
 
@@ -122,46 +184,47 @@ def authors(draw):
     return draw(st.one_of(human_authors(), agent_authors()))
 
 
+_OPTIONAL_AUTHOR = st.none() | authors()
+
+
 # =============================================================================
 # Location Strategies
 # =============================================================================
 
 
+# Example selector paths for each selector type
+_SELECTOR_PATHS = {
+    "symbol": st.sampled_from(
+        [
+            "MyClass.my_method",
+            "calculate_total",
+            "UserService.authenticate",
+            "Config.timeout",
+        ]
+    ),
+    "ast": st.sampled_from(
+        [
+            "function_definition[name='foo']",
+            "class_definition[name='Bar']",
+            "import_statement",
+        ]
+    ),
+    "lsp": st.sampled_from(
+        [
+            "pkg::module::Struct::field",
+            "crate::lib::function",
+            "std::collections::HashMap",
+        ]
+    ),
+}
+_SELECTOR_TYPES = st.sampled_from(list(_SELECTOR_PATHS))
+
+
 @st.composite
 def selectors(draw):
     """Generate semantic code selectors."""
-    selector_type = draw(st.sampled_from(["symbol", "ast", "lsp"]))
-    if selector_type == "symbol":
-        path = draw(
-            st.sampled_from(
-                [
-                    "MyClass.my_method",
-                    "calculate_total",
-                    "UserService.authenticate",
-                    "Config.timeout",
-                ]
-            )
-        )
-    elif selector_type == "ast":
-        path = draw(
-            st.sampled_from(
-                [
-                    "function_definition[name='foo']",
-                    "class_definition[name='Bar']",
-                    "import_statement",
-                ]
-            )
-        )
-    else:
-        path = draw(
-            st.sampled_from(
-                [
-                    "pkg::module::Struct::field",
-                    "crate::lib::function",
-                    "std::collections::HashMap",
-                ]
-            )
-        )
+    selector_type = draw(_SELECTOR_TYPES)
+    path = draw(_SELECTOR_PATHS[selector_type])
     return Selector(type=selector_type, path=path)
 
 
@@ -200,175 +263,129 @@ def locations(draw):
     )
 
 
+_OPTIONAL_LOCATION = st.none() | locations()
+
+
 # =============================================================================
 # Activity Strategies (one per type)
 # =============================================================================
 
+# Strategies without dependencies between fields use st.builds. They are
+# cached: callers that ask for them on every draw share one strategy object
+# instead of setting up a new st.builds each time.
 
-@st.composite
-def comments(draw):
+
+@cache
+def comments(xml_safe=False):
     """Generate Comment activities with all 7 categories."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    category = draw(
-        st.sampled_from(
+    return st.builds(
+        Comment,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.sampled_from(
             ["note", "suggestion", "issue", "praise", "question", "task", "security"]
-        )
-    )
-    content = draw(
-        st.text(min_size=1, max_size=500, alphabet=st.characters(blacklist_categories=("Cs",)))
-    )
-    location = draw(st.none() | locations())
-    context = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    mentions_list = draw(st.lists(mentions(), max_size=3))
-    supersedes = draw(st.lists(ids(), max_size=2))
-    addresses = draw(st.lists(ids(), max_size=2))
-    severity = draw(
-        st.none() | st.sampled_from(["info", "warning", "error", "critical"])
-    )
-
-    return Comment(
-        id=activity_id,
-        author=author,
-        category=category,
-        content=content,
-        location=location,
-        context=context,
-        mentions=mentions_list,
-        supersedes=supersedes,
-        addresses=addresses,
-        severity=severity,
+        ),
+        content=_CONTENT_TEXT[xml_safe],
+        location=_OPTIONAL_LOCATION,
+        context=_OPTIONAL_SHORT_TEXT[xml_safe],
+        mentions=st.lists(mentions(), max_size=3),
+        supersedes=st.lists(ids(), max_size=2),
+        addresses=st.lists(ids(), max_size=2),
+        severity=st.none() | st.sampled_from(["info", "warning", "error", "critical"]),
     )
 
 
-@st.composite
-def review_marks(draw):
+@cache
+def review_marks(xml_safe=False):
     """Generate ReviewMark activities (reviewed | ignored)."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    category = draw(st.sampled_from(["reviewed", "ignored"]))
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    location = draw(st.none() | locations())
-
-    return ReviewMark(
-        id=activity_id,
-        author=author,
-        category=category,
-        content=content,
-        location=location,
+    return st.builds(
+        ReviewMark,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.sampled_from(["reviewed", "ignored"]),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
+        location=_OPTIONAL_LOCATION,
     )
 
 
-@st.composite
-def resolutions(draw):
+@cache
+def resolutions(xml_safe=False):
     """Generate Resolution activities."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    addresses = draw(st.lists(ids(), min_size=0, max_size=5))
-
-    return Resolution(
-        id=activity_id,
-        author=author,
-        category="resolved",
-        content=content,
-        addresses=addresses,
+    return st.builds(
+        Resolution,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.just("resolved"),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
+        addresses=st.lists(ids(), min_size=0, max_size=5),
     )
 
 
-@st.composite
-def retractions(draw):
+@cache
+def retractions(xml_safe=False):
     """Generate Retraction activities."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    addresses = draw(st.lists(ids(), min_size=1, max_size=5))
-
-    return Retraction(
-        id=activity_id,
-        author=author,
-        category="retract",
-        content=content,
-        addresses=addresses,
+    return st.builds(
+        Retraction,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.just("retract"),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
+        addresses=st.lists(ids(), min_size=1, max_size=5),
     )
 
 
-@st.composite
-def mention_activities(draw):
+@cache
+def mention_activities(xml_safe=False):
     """Generate Mention activities."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    mentions_list = draw(st.lists(mentions(), min_size=1, max_size=5))
-    addresses = draw(st.lists(ids(), max_size=3))
-
-    return Mention(
-        id=activity_id,
-        author=author,
-        category="mention",
-        content=content,
-        mentions=mentions_list,
-        addresses=addresses,
+    return st.builds(
+        Mention,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.just("mention"),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
+        mentions=st.lists(mentions(), min_size=1, max_size=5),
+        addresses=st.lists(ids(), max_size=3),
     )
 
 
-@st.composite
-def assignments(draw):
+@cache
+def assignments(xml_safe=False):
     """Generate Assignment activities."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    mentions_list = draw(st.lists(mentions(), min_size=1, max_size=5))
-
-    return Assignment(
-        id=activity_id,
-        author=author,
-        category="assigned",
-        content=content,
-        mentions=mentions_list,
+    return st.builds(
+        Assignment,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.just("assigned"),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
+        mentions=st.lists(mentions(), min_size=1, max_size=5),
     )
 
 
-@st.composite
-def status_changes(draw):
+@cache
+def status_changes(xml_safe=False):
     """Generate StatusChange activities (closed | merged | reopened)."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    category = draw(st.sampled_from(["closed", "merged", "reopened"]))
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-
-    return StatusChange(
-        id=activity_id,
-        author=author,
-        category=category,
-        content=content,
+    return st.builds(
+        StatusChange,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.sampled_from(["closed", "merged", "reopened"]),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
     )
 
 
-@st.composite
-def verdicts(draw):
+@cache
+def verdicts(xml_safe=False):
     """Generate Verdict activities."""
-    activity_id = draw(ids())
-    author = draw(st.none() | authors())
-    category = draw(
-        st.sampled_from(["approved", "changes_requested", "commented", "pending"])
-    )
-    content = draw(st.none() | st.text(max_size=200, alphabet=st.characters(blacklist_categories=("Cs",))))
-    conditions = draw(
-        st.lists(
-            st.sampled_from(
-                ["after CI passes", "pending review", "after fixing issues"]
-            ),
+    return st.builds(
+        Verdict,
+        id=ids(),
+        author=_OPTIONAL_AUTHOR,
+        category=st.sampled_from(["approved", "changes_requested", "commented", "pending"]),
+        content=_OPTIONAL_SHORT_TEXT[xml_safe],
+        conditions=st.lists(
+            st.sampled_from(["after CI passes", "pending review", "after fixing issues"]),
             max_size=3,
-        )
-    )
-
-    return Verdict(
-        id=activity_id,
-        author=author,
-        category=category,
-        content=content,
-        conditions=conditions,
+        ),
     )
 
 
@@ -377,45 +394,54 @@ def verdicts(draw):
 # =============================================================================
 
 
-@st.composite
-def activities_without_replies(draw):
+@cache
+def activities_without_replies(xml_safe=False):
     """Generate any valid activity without nested replies."""
-    return draw(
-        st.one_of(
-            comments(),
-            review_marks(),
-            resolutions(),
-            retractions(),
-            mention_activities(),
-            assignments(),
-            status_changes(),
-            verdicts(),
-        )
+    return st.one_of(
+        comments(xml_safe),
+        review_marks(xml_safe),
+        resolutions(xml_safe),
+        retractions(xml_safe),
+        mention_activities(xml_safe),
+        assignments(xml_safe),
+        status_changes(xml_safe),
+        verdicts(xml_safe),
     )
 
 
 @st.composite
-def activities_with_replies(draw, max_depth=3):
-    """Generate activities with bounded nested replies."""
-    activity = draw(activities_without_replies())
-
-    if max_depth <= 0:
-        return activity
-
-    num_replies = draw(st.integers(min_value=0, max_value=2))
-    if num_replies == 0:
-        return activity
-
-    replies = [
-        draw(activities_with_replies(max_depth=max_depth - 1))
-        for _ in range(num_replies)
-    ]
-    return activity.model_copy(update={"replies": replies})
-
-
-def activities():
+def activities_with_replies(draw, max_depth=3, xml_safe=False):
+    """Generate activities with bounded nested replies.
+
+    The reply tree is grown breadth-first in this one draw (up to two replies
+    per activity), then replies are attached bottom-up.
+    """
+    nodes = [draw(activities_without_replies(xml_safe))]
+    depths = [0]
+    children = [[]]
+
+    i = 0
+    while i < len(nodes):
+        if depths[i] < max_depth:
+            for _ in range(draw(st.integers(min_value=0, max_value=2))):
+                children[i].append(len(nodes))
+                nodes.append(draw(activities_without_replies(xml_safe)))
+                depths.append(depths[i] + 1)
+                children.append([])
+        i += 1
+
+    # Replies always come after their parent, so walking backwards attaches
+    # each subtree once it is complete
+    for i in reversed(range(len(nodes))):
+        if children[i]:
+            replies = [nodes[child] for child in children[i]]
+            nodes[i] = nodes[i].model_copy(update={"replies": replies})
+    return nodes[0]
+
+
+def activities(xml_safe=False):
     """Generate any valid activity (union of all types), potentially with replies."""
-    return activities_with_replies(max_depth=2)
+    return activities_with_replies(max_depth=2, xml_safe=xml_safe)
 
 
 # =============================================================================
@@ -423,106 +449,96 @@ def activities():
 # =============================================================================
 
 
-@st.composite
-def patch_subjects(draw):
+@cache
+def patch_subjects():
     """Generate patch/PR subjects."""
-    provider = draw(
-        st.none()
-        | st.sampled_from(["github-pr", "gitlab-mr", "gerrit", "phabricator", "diff"])
-    )
-    provider_ref = draw(st.none() | st.text(min_size=1, max_size=20, alphabet="0123456789"))
-    repo = draw(st.none() | st.sampled_from(["owner/repo", "org/project", "user/lib"]))
-    base = draw(st.none() | st.sampled_from(["main", "master", "develop"]))
-    head = draw(st.none() | st.sampled_from(["feature-branch", "fix/bug", "pr-123"]))
-    url = draw(st.none() | st.just("https://github.com/org/repo/pull/123"))
-
-    return Subject(
-        type="patch",
-        provider=provider,
-        provider_ref=provider_ref,
-        repo=repo,
-        base=base,
-        head=head,
-        url=url,
+    return st.builds(
+        Subject,
+        type=st.just("patch"),
+        provider=st.none()
+        | st.sampled_from(["github-pr", "gitlab-mr", "gerrit", "phabricator", "diff"]),
+        provider_ref=st.none() | st.text(min_size=1, max_size=20, alphabet="0123456789"),
+        repo=st.none() | st.sampled_from(["owner/repo", "org/project", "user/lib"]),
+        base=st.none() | st.sampled_from(["main", "master", "develop"]),
+        head=st.none() | st.sampled_from(["feature-branch", "fix/bug", "pr-123"]),
+        url=st.none() | st.just("https://github.com/org/repo/pull/123"),
     )
 
 
-@st.composite
-def commit_subjects(draw):
+@cache
+def commit_subjects():
     """Generate commit subjects."""
-    commit = draw(
-        st.text(min_size=40, max_size=40, alphabet="0123456789abcdef")
-        | st.text(min_size=7, max_size=7, alphabet="0123456789abcdef")
+    return st.builds(
+        Subject,
+        type=st.just("commit"),
+        commit=_SHA | _SHORT_SHA,
     )
-    return Subject(type="commit", commit=commit)
 
 
-@st.composite
-def file_subjects(draw):
+@cache
+def file_subjects():
     """Generate file subjects."""
-    path = draw(file_paths())
-    blob = draw(st.none() | st.text(min_size=40, max_size=40, alphabet="0123456789abcdef"))
-    checksum = draw(st.none() | st.just("sha256:abc123def456"))
-
-    return Subject(type="file", path=path, blob=blob, checksum=checksum)
+    return st.builds(
+        Subject,
+        type=st.just("file"),
+        path=file_paths(),
+        blob=_OPTIONAL_SHA,
+        checksum=st.none() | st.just("sha256:abc123def456"),
+    )
 
 
-@st.composite
-def directory_subjects(draw):
+@cache
+def directory_subjects():
     """Generate directory subjects."""
-    path = draw(st.sampled_from(["src/", "lib/", "tests/", "pkg/internal/"]))
-    tree = draw(st.none() | st.text(min_size=40, max_size=40, alphabet="0123456789abcdef"))
-
-    return Subject(type="directory", path=path, tree=tree)
+    return st.builds(
+        Subject,
+        type=st.just("directory"),
+        path=st.sampled_from(["src/", "lib/", "tests/", "pkg/internal/"]),
+        tree=_OPTIONAL_SHA,
+    )
 
 
-@st.composite
-def audit_subjects(draw):
+@cache
+def audit_subjects():
     """Generate audit subjects."""
-    name = draw(
-        st.sampled_from(
+    return st.builds(
+        Subject,
+        type=st.just("audit"),
+        name=st.sampled_from(
             ["Security Audit Q1", "Code Review 2024", "Architecture Assessment"]
-        )
-    )
-    scope = draw(
-        st.lists(
+        ),
+        scope=st.lists(
             st.sampled_from(["src/**", "lib/*.py", "tests/", "pkg/internal/**"]),
             min_size=1,
             max_size=5,
-        )
+        ),
+        commit=_OPTIONAL_SHA,
     )
-    commit = draw(st.none() | st.text(min_size=40, max_size=40, alphabet="0123456789abcdef"))
 
-    return Subject(type="audit", name=name, scope=scope, commit=commit)
 
-
-@st.composite
-def snapshot_subjects(draw):
+@cache
+def snapshot_subjects():
     """Generate snapshot subjects."""
-    from datetime import datetime, timezone
-
-    timestamp = draw(
-        st.datetimes(
+    return st.builds(
+        Subject,
+        type=st.just("snapshot"),
+        timestamp=st.datetimes(
             min_value=datetime(2020, 1, 1), max_value=datetime(2030, 1, 1)
-        ).map(lambda dt: dt.replace(tzinfo=timezone.utc))
+        ).map(lambda dt: dt.replace(tzinfo=timezone.utc)),
+        commit=_OPTIONAL_SHA,
     )
-    commit = draw(st.none() | st.text(min_size=40, max_size=40, alphabet="0123456789abcdef"))
-
-    return Subject(type="snapshot", timestamp=timestamp, commit=commit)
 
 
-@st.composite
-def subjects(draw):
+@cache
+def subjects():
     """Generate any valid subject."""
-    return draw(
-        st.one_of(
-            patch_subjects(),
-            commit_subjects(),
-            file_subjects(),
-            directory_subjects(),
-            audit_subjects(),
-            snapshot_subjects(),
-        )
+    return st.one_of(
+        patch_subjects(),
+        commit_subjects(),
+        file_subjects(),
+        directory_subjects(),
+        audit_subjects(),
+        snapshot_subjects(),
     )
 
 
@@ -531,52 +547,49 @@ def subjects(draw):
 # =============================================================================
 
 
-@st.composite
-def agent_contexts(draw):
+@cache
+def agent_contexts(xml_safe=False):
     """Generate agent context configurations."""
-    instructions = draw(
-        st.none()
+    return st.builds(
+        AgentContext,
+        instructions=st.none()
         | st.sampled_from(
             [
                 "Focus on security issues.",
                 "Review for performance.",
                 "Check for code style compliance.",
             ]
-        )
-    )
-    diff = draw(st.none() | st.text(max_size=1000, alphabet=st.characters(blacklist_categories=("Cs",))))
-    settings = draw(
-        st.none()
+        ),
+        diff=st.none() | _LONG_TEXT[xml_safe],
+        settings=st.none()
         | st.fixed_dictionaries(
             {
                 "auto_respond": st.booleans(),
                 "require_mention": st.booleans(),
             }
-        )
+        ),
     )
 
-    return AgentContext(instructions=instructions, diff=diff, settings=settings)
-
 
 # =============================================================================
 # Review Strategies
 # =============================================================================
 
 
-@st.composite
-def reviews(draw):
-    """Generate full Review objects."""
-    subject = draw(st.none() | subjects())
-    activity_list = draw(st.lists(activities(), min_size=0, max_size=20))
-    agent_context = draw(st.none() | agent_contexts())
-    metadata = draw(st.none() | st.fixed_dictionaries({"custom_field": st.text(max_size=50)}))
-
-    return Review(
-        version="0.1",
-        subject=subject,
-        activities=activity_list,
-        agent_context=agent_context,
-        metadata=metadata,
+@cache
+def reviews(xml_safe=False):
+    """Generate full Review objects.
+
+    With xml_safe, all free text can be written to XML and read back unchanged.
+    """
+    return st.builds(
+        Review,
+        version=st.just("0.1"),
+        subject=st.none() | subjects(),
+        activities=st.lists(activities(xml_safe), min_size=0, max_size=20),
+        agent_context=st.none() | agent_contexts(xml_safe),
+        metadata=st.none()
+        | st.fixed_dictionaries({"custom_field": _METADATA_TEXT[xml_safe]}),
     )
 
 
@@ -627,14 +640,11 @@ def reviews_with_supersedes_and_retracts(draw):
 @st.composite
 def deeply_nested_replies(draw, max_depth=10):
     """Generate activities with deep nesting for edge case testing."""
-    activity = draw(comments())
-
-    def add_replies(act, depth):
-        if depth <= 0:
-            return act
-        reply = draw(comments())
-        reply = add_replies(reply, depth - 1)
-        return act.model_copy(update={"replies": [reply]})
-
     depth = draw(st.integers(min_value=1, max_value=max_depth))
-    return add_replies(activity, depth)
+    chain = [draw(comments()) for _ in range(depth + 1)]
+
+    # Wrap from the innermost reply outwards
+    activity = chain.pop()
+    while chain:
+        activity = chain.pop().model_copy(update={"replies": [activity]})
+    return activity
@@ -6,50 +6,103 @@ from pathlib import Path
 
 import pytest
 
+import opencodereview as ocr
+
 EXAMPLES_DIR = Path(__file__).parent.parent.parent / "examples"
+EXAMPLE_FILES = sorted(f for f in EXAMPLES_DIR.glob("**/*") if f.is_file())
+YAML_FILES = [f for f in EXAMPLE_FILES if f.suffix == ".yaml"]
+JSON_FILES = [f for f in EXAMPLE_FILES if f.suffix == ".json"]
+XML_FILES = [f for f in EXAMPLE_FILES if f.suffix == ".xml"]
+
+
+def run_cli(command, *args):
+    """Run a CLI command in-process and return its click Result."""
+    from click.testing import CliRunner
+    from opencodereview import cli
+
+    factory = {"validate": cli._validate_command, "convert": cli._convert_command}[command]
+    return CliRunner().invoke(factory(), [str(arg) for arg in args])
 
 
 class TestValidate:
     """Tests for ocr-validate command."""
 
-    def test_validate_yaml_files(self):
-        """Validate all YAML example files."""
-        yaml_files = list(EXAMPLES_DIR.glob("**/*.yaml"))
-        assert len(yaml_files) > 0, "No YAML files found"
+    def test_validate_all_examples(self):
+        """Validate every YAML, JSON and XML example file in one run."""
+        assert len(YAML_FILES) > 0, "No YAML files found"
+        assert len(JSON_FILES) > 0, "No JSON files found"
+        assert len(XML_FILES) > 0, "No XML files found"
 
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "validate", *[str(f) for f in yaml_files]],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Validation failed:\n{result.stdout}\n{result.stderr}"
+        result = run_cli("validate", *EXAMPLE_FILES)
+        assert result.exit_code == 0, f"Validation failed:\n{result.output}"
 
-    def test_validate_json_files(self):
-        """Validate all JSON example files."""
-        json_files = list(EXAMPLES_DIR.glob("**/*.json"))
-        assert len(json_files) > 0, "No JSON files found"
+    def test_validate_serial_and_parallel_agree(self):
+        """Validation output is the same with one or several workers."""
+        outputs = []
+        for jobs in ("1", "2"):
+            result = run_cli("validate", "-j", jobs, *YAML_FILES)
+            assert result.exit_code == 0, f"Validation failed:\n{result.output}"
+            outputs.append(result.stdout)
 
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "validate", *[str(f) for f in json_files]],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Validation failed:\n{result.stdout}\n{result.stderr}"
+        assert outputs[0] == outputs[1]
 
-    def test_validate_xml_files(self):
-        """Validate all XML example files."""
-        xml_files = list(EXAMPLES_DIR.glob("**/*.xml"))
-        assert len(xml_files) > 0, "No XML files found"
+    def test_worker_failure_fails_only_its_file(self):
+        """An exception raised in a worker becomes that file's error."""
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+        from opencodereview.cli import _future_errors
 
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "validate", *[str(f) for f in xml_files]],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Validation failed:\n{result.stdout}\n{result.stderr}"
+        done, broken = Future(), Future()
+        done.set_result([])
+        broken.set_exception(BrokenProcessPool("worker died"))
+
+        assert _future_errors(done) == []
+        assert _future_errors(broken) == ["worker died"]
+
+    def test_validate_schema_only(self):
+        """Schema-only validation accepts all example files."""
+        result = run_cli("validate", "--schema-only", *EXAMPLE_FILES)
+        assert result.exit_code == 0, f"Validation failed:\n{result.output}"
+
+    @pytest.mark.parametrize("flags", [[], ["--batch"]], ids=["per-file", "batch"])
+    def test_validate_checks_model_data_unless_schema_only(self, tmp_path, flags):
+        """Keys the model fills in by default are only required with --schema-only."""
+        review = tmp_path / "defaults.yaml"
+        review.write_text("version: '0.1'\n")
+
+        assert run_cli("validate", *flags, review).exit_code == 0
+        assert run_cli("validate", "--schema-only", *flags, review).exit_code == 1
+
+    def test_validate_batch_matches_per_file(self, tmp_path):
+        """Batch mode reports the same results as validating file by file."""
+        invalid = tmp_path / "invalid.yaml"
+        invalid.write_text("version: '0.1'\nactivities:\n  - category: bogus\n")
+        files = [*EXAMPLE_FILES, invalid]
+
+        outputs = []
+        for flags in ([], ["--batch"]):
+            result = run_cli("validate", "-j", "1", *flags, *files)
+            assert result.exit_code == 1
+            outputs.append(result.stdout)
+        assert outputs[0] == outputs[1]
+        assert f"FAIL: {invalid}\n  - activities.0" in outputs[1]
+
+    def test_validate_batch_matches_per_file_for_missing_keys(self, tmp_path):
+        """Missing top-level keys are reported the same way with and without --batch."""
+        invalid = tmp_path / "invalid.yaml"
+        invalid.write_text("activities:\n  - category: bogus\n")
+
+        outputs = []
+        for flags in ([], ["--batch"]):
+            result = run_cli("validate", "--schema-only", *flags, invalid)
+            assert result.exit_code == 1
+            outputs.append(result.stdout)
+        assert outputs[0] == outputs[1]
+        assert "(root): 'version' is a required property" in outputs[0]
+        assert "activities.0.category:" in outputs[0]
 
     def test_validate_nonexistent_file(self):
-        """Validate returns error for nonexistent file."""
+        """Validate returns error for nonexistent file (via python -m)."""
         result = subprocess.run(
             [sys.executable, "-m", "opencodereview.cli", "validate", "nonexistent.yaml"],
             capture_output=True,
@@ -57,71 +110,49 @@ class TestValidate:
         )
         assert result.returncode != 0
 
-    def test_validate_quiet_mode(self):
-        """Validate quiet mode only shows errors."""
-        yaml_file = next(EXAMPLES_DIR.glob("**/*.yaml"))
+    def test_validate_dependencies_are_imported_on_use(self):
+        """Importing the CLI leaves the parsers and validators unloaded."""
+        deferred = ["yaml", "pydantic", "fastjsonschema", "orjson", "jsonschema"]
         result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "validate", "-q", str(yaml_file)],
+            [
+                sys.executable,
+                "-c",
+                f"import sys, opencodereview.cli; print([m for m in {deferred!r} if m in sys.modules])",
+            ],
             capture_output=True,
             text=True,
         )
-        assert result.returncode == 0
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
+    def test_validate_quiet_mode(self):
+        """Validate quiet mode only shows errors."""
+        result = run_cli("validate", "-q", YAML_FILES[0])
+        assert result.exit_code == 0
         assert result.stdout == "", "Quiet mode should not output anything on success"
 
 
 class TestConvert:
     """Tests for ocr-convert command."""
 
-    def test_convert_yaml_to_json(self, tmp_path):
-        """Convert YAML to JSON."""
-        yaml_file = EXAMPLES_DIR / "yaml" / "00-minimal.yaml"
-        json_output = tmp_path / "output.json"
-
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "convert", str(yaml_file), str(json_output)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Conversion failed:\n{result.stdout}\n{result.stderr}"
-        assert json_output.exists()
-
-        # Verify the output is valid JSON that can be loaded
-        import opencodereview as ocr
-        review = ocr.load(json_output)
-        assert review.version == "0.1"
-
-    def test_convert_json_to_yaml(self, tmp_path):
-        """Convert JSON to YAML."""
-        json_file = EXAMPLES_DIR / "json" / "00-minimal.json"
-        yaml_output = tmp_path / "output.yaml"
-
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "convert", str(json_file), str(yaml_output)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Conversion failed:\n{result.stdout}\n{result.stderr}"
-        assert yaml_output.exists()
-
-        import opencodereview as ocr
-        review = ocr.load(yaml_output)
-        assert review.version == "0.1"
-
-    def test_convert_yaml_to_xml(self, tmp_path):
-        """Convert YAML to XML."""
-        yaml_file = EXAMPLES_DIR / "yaml" / "00-minimal.yaml"
-        xml_output = tmp_path / "output.xml"
+    @pytest.mark.parametrize(
+        "source, suffix",
+        [
+            ("yaml/00-minimal.yaml", ".json"),
+            ("json/00-minimal.json", ".yaml"),
+            ("yaml/00-minimal.yaml", ".xml"),
+        ],
+        ids=["yaml-to-json", "json-to-yaml", "yaml-to-xml"],
+    )
+    def test_convert_formats(self, tmp_path, source, suffix):
+        """Convert between formats; the output loads as a review."""
+        output = tmp_path / f"output{suffix}"
 
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "convert", str(yaml_file), str(xml_output)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Conversion failed:\n{result.stdout}\n{result.stderr}"
-        assert xml_output.exists()
+        result = run_cli("convert", EXAMPLES_DIR / source, output)
+        assert result.exit_code == 0, f"Conversion failed:\n{result.output}"
+        assert output.exists()
 
-        import opencodereview as ocr
-        review = ocr.load(xml_output)
+        review = ocr.load(output)
         assert review.version == "0.1"
 
     def test_convert_refuses_overwrite(self, tmp_path):
@@ -130,12 +161,8 @@ class TestConvert:
         json_output = tmp_path / "output.json"
         json_output.write_text("{}")
 
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "convert", str(yaml_file), str(json_output)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
+        result = run_cli("convert", yaml_file, json_output)
+        assert result.exit_code != 0
         assert "exists" in result.stderr.lower()
 
     def test_convert_force_overwrite(self, tmp_path):
@@ -144,22 +171,113 @@ class TestConvert:
         json_output = tmp_path / "output.json"
         json_output.write_text("{}")
 
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "convert", "-f", str(yaml_file), str(json_output)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Conversion failed:\n{result.stdout}\n{result.stderr}"
+        result = run_cli("convert", "-f", yaml_file, json_output)
+        assert result.exit_code == 0, f"Conversion failed:\n{result.output}"
 
-        import opencodereview as ocr
         review = ocr.load(json_output)
         assert review.version == "0.1"
 
     def test_convert_nonexistent_input(self, tmp_path):
         """Convert returns error for nonexistent input file."""
-        result = subprocess.run(
-            [sys.executable, "-m", "opencodereview.cli", "convert", "nonexistent.yaml", str(tmp_path / "out.json")],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
+        result = run_cli("convert", "nonexistent.yaml", tmp_path / "out.json")
+        assert result.exit_code != 0
+
+
+class TestSchemaValidation:
+    """Tests for the schema validation helpers used by ocr-validate."""
+
+    def test_invalid_data_reports_errors(self):
+        """Invalid data yields path-prefixed error messages."""
+        import jsonschema
+        from opencodereview.cli import _compile_schema, _load_schema, _validate_schema
+
+        schema = _load_schema()
+        validator = jsonschema.Draft7Validator(schema)
+        data = {"version": "0.1", "activities": [{"category": "bogus"}]}
+
+        errors = _validate_schema(data, validator, _compile_schema(schema))
+        assert len(errors) == 1
+        assert errors[0].startswith("activities.0.category:")
+
+    def test_fail_fast_reports_first_error_only(self):
+        """fail_fast stops collecting after the first schema error."""
+        import jsonschema
+        from opencodereview.cli import _load_schema, _validate_schema
+
+        validator = jsonschema.Draft7Validator(_load_schema())
+        data = {"version": "0.1", "activities": [{"category": "bogus"}, {"category": "bogus"}]}
+
+        assert len(_validate_schema(data, validator)) == 2
+        assert len(_validate_schema(data, validator, fail_fast=True)) == 1
+
+    def test_valid_data_has_no_errors(self):
+        """Valid data yields no errors with or without the compiled fast path."""
+        import jsonschema
+        from opencodereview.cli import _compile_schema, _load_schema, _validate_schema
+
+        schema = _load_schema()
+        validator = jsonschema.Draft7Validator(schema)
+        data = {"version": "0.1", "activities": [{"id": "c1", "category": "note"}]}
+
+        assert _validate_schema(data, validator) == []
+        assert _validate_schema(data, validator, _compile_schema(schema)) == []
+
+    def test_compiled_validator_is_cached_on_disk(self, tmp_path, monkeypatch):
+        """The compiled validator is written to and reused from the cache dir."""
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+        from opencodereview.cli import _compile_schema, _load_schema
+
+        stale = tmp_path / "opencodereview" / "validator_review_0123456789abcdef.py"
+        stale.parent.mkdir()
+        stale.write_text("validate = None\n")
+        schema = _load_schema()
+        data = {"version": "0.1", "activities": [{"id": "c1", "category": "note"}]}
+
+        first = _compile_schema(schema)
+        cached = list((tmp_path / "opencodereview").glob("validator_*.py"))
+        assert len(cached) == 1
+        assert cached[0] != stale
+
+        written = cached[0].stat()
+
+        def compile_again(*args, **kwargs):
+            raise AssertionError("cached validator was compiled again")
+
+        monkeypatch.setattr(fastjsonschema, "compile_to_code", compile_again)
+        second = _compile_schema(schema)
+        reused = cached[0].stat()
+        assert (reused.st_ino, reused.st_mtime_ns) == (written.st_ino, written.st_mtime_ns)
+        assert first(data) == data
+        assert second(data) == data
+
+
+class TestWalkFiles:
+    """Tests for the file listing used when git is unavailable."""
+
+    def test_skips_ignored_directories(self, tmp_path):
+        """Files below ignored directories are never listed."""
+        from opencodereview.cli import _walk_files
+
+        (tmp_path / "src" / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "node_modules" / "pkg" / "index.js").write_text("")
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / "README.md").write_text("")
+
+        files = _walk_files(str(tmp_path), {"node_modules"})
+        assert sorted(files) == ["README.md", str(Path("src") / "main.py")]
+
+
+class TestEditInEditor:
+    """Tests for collecting multiline input through $EDITOR."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the editor")
+    def test_non_ascii_text_round_trips(self, tmp_path, monkeypatch):
+        """The temp file is written and read back as UTF-8."""
+        from opencodereview import cli
+
+        editor = tmp_path / "editor.sh"
+        editor.write_text('#!/bin/sh\nprintf " \\342\\234\\223" >> "$1"\n')
+        editor.chmod(0o755)
+        monkeypatch.setattr(cli, "_find_editor", lambda: str(editor))
+
+        assert cli._edit_in_editor("héllo") == "héllo ✓"
@@ -1,10 +1,12 @@
 """Test that all example files validate correctly."""
 
+import io
+import os
 from pathlib import Path
 
 import pytest
 
-from opencodereview import load, Review
+from opencodereview import load, load_raw, Review
 
 
 # Find all example files
@@ -14,32 +16,68 @@ JSON_EXAMPLES = list(EXAMPLES_DIR.glob("json/*.json"))
 XML_EXAMPLES = list(EXAMPLES_DIR.glob("xml/*.xml"))
 
 
-@pytest.mark.parametrize("example_file", YAML_EXAMPLES, ids=lambda p: p.name)
-def test_yaml_examples_validate(example_file: Path):
+# Session fixtures, parametrized indirectly with example paths, load each
+# example once. Every test of the same example gets the same Review, so
+# tests must not modify it.
+@pytest.fixture(scope="session")
+def yaml_example(request) -> Review:
+    """The YAML example passed as the parameter, loaded once per session."""
+    return load(request.param)
+
+
+@pytest.fixture(scope="session")
+def json_example(request) -> Review:
+    """The JSON example passed as the parameter, loaded once per session."""
+    return load(request.param)
+
+
+@pytest.fixture(scope="session")
+def xml_example(request) -> Review:
+    """The XML example passed as the parameter, loaded once per session."""
+    return load(request.param)
+
+
+@pytest.mark.parametrize("yaml_example", YAML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+def test_yaml_examples_validate(yaml_example: Review):
     """Each YAML example should load and validate successfully."""
-    review = load(example_file)
+    review = yaml_example
     assert isinstance(review, Review)
     assert review.version == "0.1"
     assert isinstance(review.activities, list)
 
 
-@pytest.mark.parametrize("example_file", JSON_EXAMPLES, ids=lambda p: p.name)
-def test_json_examples_validate(example_file: Path):
+@pytest.mark.parametrize("json_example", JSON_EXAMPLES, ids=lambda p: p.name, indirect=True)
+def test_json_examples_validate(json_example: Review):
     """Each JSON example should load and validate successfully."""
-    review = load(example_file)
+    review = json_example
     assert isinstance(review, Review)
     assert review.version == "0.1"
 
 
-@pytest.mark.parametrize("example_file", XML_EXAMPLES, ids=lambda p: p.name)
-def test_xml_examples_validate(example_file: Path):
+@pytest.mark.parametrize("xml_example", XML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+def test_xml_examples_validate(xml_example: Review):
     """Each XML example should load and validate successfully."""
-    review = load(example_file)
+    review = xml_example
     assert isinstance(review, Review)
     assert review.version == "0.1"
     assert isinstance(review.activities, list)
 
 
+def test_load_raw_keeps_yaml_timestamps_as_strings(tmp_path: Path):
+    """load_raw returns JSON-compatible data without model validation."""
+    path = tmp_path / "review.yaml"
+    path.write_text(
+        "version: '0.1'\n"
+        "activities:\n"
+        "  - category: note\n"
+        "    created: 2024-01-15T10:30:00Z\n"
+    )
+
+    data = load_raw(path)
+    assert data["activities"][0]["created"] == "2024-01-15T10:30:00Z"
+    assert load(path).activities[0].created is not None
+
+
 def test_minimal_example_structure():
     """Test the minimal example has expected structure."""
     minimal = EXAMPLES_DIR / "yaml" / "00-minimal.yaml"
@@ -131,6 +169,8 @@ def test_computed_reviewers():
     assert "@charlie" in reviewers
     # Should deduplicate
     assert len(reviewers) == 3
+    # Ordered by first mention
+    assert reviewers == ["@alice", "@bob", "@charlie"]
 
 
 def test_get_visible_activities():
@@ -160,13 +200,12 @@ def test_get_visible_activities():
 class TestFormatConversion:
     """Test loading from one format, converting to another, and checking equality."""
 
-    @pytest.mark.parametrize("example_file", YAML_EXAMPLES, ids=lambda p: p.name)
-    def test_yaml_to_json_roundtrip(self, example_file: Path, tmp_path: Path):
+    @pytest.mark.parametrize("yaml_example", YAML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+    def test_yaml_to_json_roundtrip(self, yaml_example: Review, tmp_path: Path):
         """Load YAML, save as JSON, reload and compare."""
-        from opencodereview import load, dump
+        from opencodereview import dump
 
-        # Load original YAML
-        original = load(example_file)
+        original = yaml_example
 
         # Save as JSON
         json_file = tmp_path / "converted.json"
@@ -178,13 +217,12 @@ class TestFormatConversion:
         # Compare
         assert_reviews_equal(original, reloaded)
 
-    @pytest.mark.parametrize("example_file", YAML_EXAMPLES, ids=lambda p: p.name)
-    def test_yaml_to_json_to_yaml_roundtrip(self, example_file: Path, tmp_path: Path):
+    @pytest.mark.parametrize("yaml_example", YAML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+    def test_yaml_to_json_to_yaml_roundtrip(self, yaml_example: Review, tmp_path: Path):
         """Load YAML, save as JSON, reload, save as YAML, reload and compare."""
-        from opencodereview import load, dump
+        from opencodereview import dump
 
-        # Load original YAML
-        original = load(example_file)
+        original = yaml_example
 
         # Save as JSON
         json_file = tmp_path / "converted.json"
@@ -203,13 +241,12 @@ class TestFormatConversion:
         # Compare with original
         assert_reviews_equal(original, final)
 
-    @pytest.mark.parametrize("example_file", JSON_EXAMPLES, ids=lambda p: p.name)
-    def test_json_to_yaml_roundtrip(self, example_file: Path, tmp_path: Path):
+    @pytest.mark.parametrize("json_example", JSON_EXAMPLES, ids=lambda p: p.name, indirect=True)
+    def test_json_to_yaml_roundtrip(self, json_example: Review, tmp_path: Path):
         """Load JSON, save as YAML, reload and compare."""
-        from opencodereview import load, dump
+        from opencodereview import dump
 
-        # Load original JSON
-        original = load(example_file)
+        original = json_example
 
         # Save as YAML
         yaml_file = tmp_path / "converted.yaml"
@@ -221,13 +258,12 @@ class TestFormatConversion:
         # Compare
         assert_reviews_equal(original, reloaded)
 
-    @pytest.mark.parametrize("example_file", XML_EXAMPLES, ids=lambda p: p.name)
-    def test_xml_to_yaml_roundtrip(self, example_file: Path, tmp_path: Path):
+    @pytest.mark.parametrize("xml_example", XML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+    def test_xml_to_yaml_roundtrip(self, xml_example: Review, tmp_path: Path):
         """Load XML, save as YAML, reload and compare."""
-        from opencodereview import load, dump
+        from opencodereview import dump
 
-        # Load original XML
-        original = load(example_file)
+        original = xml_example
 
         # Save as YAML
         yaml_file = tmp_path / "converted.yaml"
@@ -239,13 +275,12 @@ class TestFormatConversion:
         # Compare
         assert_reviews_equal(original, reloaded)
 
-    @pytest.mark.parametrize("example_file", YAML_EXAMPLES, ids=lambda p: p.name)
-    def test_yaml_to_xml_roundtrip(self, example_file: Path, tmp_path: Path):
+    @pytest.mark.parametrize("yaml_example", YAML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+    def test_yaml_to_xml_roundtrip(self, yaml_example: Review, tmp_path: Path):
         """Load YAML, save as XML, reload and compare."""
-        from opencodereview import load, dump
+        from opencodereview import dump
 
-        # Load original YAML
-        original = load(example_file)
+        original = yaml_example
 
         # Save as XML
         xml_file = tmp_path / "converted.xml"
@@ -257,11 +292,11 @@ class TestFormatConversion:
         # Compare
         assert_reviews_equal(original, reloaded)
 
-    def test_programmatic_review_roundtrip(self, tmp_path: Path):
+    def test_programmatic_review_roundtrip(self):
         """Create a review programmatically and test conversion roundtrip."""
         from opencodereview import (
             Review, Comment, Assignment, StatusChange, Verdict,
-            Subject, Author, Location, dump, load
+            Subject, Author, Location
         )
 
         # Create a complex review
@@ -307,20 +342,15 @@ class TestFormatConversion:
         )
 
         # YAML roundtrip
-        yaml_file = tmp_path / "review.yaml"
-        dump(original, yaml_file)
-        from_yaml = load(yaml_file)
+        from_yaml = roundtrip(original, "yaml")
         assert_reviews_equal(original, from_yaml)
 
         # JSON roundtrip
-        json_file = tmp_path / "review.json"
-        dump(original, json_file)
-        from_json = load(json_file)
+        from_json = roundtrip(original, "json")
         assert_reviews_equal(original, from_json)
 
         # Cross-format: YAML -> JSON -> compare
-        dump(from_yaml, json_file)
-        cross_converted = load(json_file)
+        cross_converted = roundtrip(from_yaml, "json")
         assert_reviews_equal(original, cross_converted)
 
     def test_nested_replies_roundtrip(self, tmp_path: Path):
@@ -373,12 +403,12 @@ class TestFormatConversion:
 
         assert_reviews_equal(from_yaml, from_json)
 
-    def test_all_activity_types_roundtrip(self, tmp_path: Path):
+    def test_all_activity_types_roundtrip(self):
         """Test that all activity types survive format conversion."""
         from opencodereview import (
             Review, Comment, ReviewMark, Resolution, Retraction,
             Mention, Assignment, StatusChange, Verdict,
-            Author, Location, dump, load
+            Author, Location
         )
 
         original = Review(
@@ -407,15 +437,11 @@ class TestFormatConversion:
         )
 
         # YAML roundtrip
-        yaml_file = tmp_path / "all_types.yaml"
-        dump(original, yaml_file)
-        from_yaml = load(yaml_file)
+        from_yaml = roundtrip(original, "yaml")
         assert len(from_yaml.activities) == len(original.activities)
 
         # JSON roundtrip
-        json_file = tmp_path / "all_types.json"
-        dump(original, json_file)
-        from_json = load(json_file)
+        from_json = roundtrip(original, "json")
 
         assert_reviews_equal(from_yaml, from_json)
 
@@ -559,11 +585,20 @@ class TestSerializationCompactness:
         assert reloaded.activities[0].addresses == []
 
 
+def roundtrip(review: Review, format: str) -> Review:
+    """Dump a review to an in-memory file and load it back."""
+    from opencodereview import dump
+
+    buf = io.StringIO()
+    dump(review, buf, format=format)
+    return load(io.BytesIO(buf.getvalue().encode()), format=format)
+
+
 def assert_reviews_equal(r1: Review, r2: Review) -> None:
     """Assert two Review objects are semantically equal."""
     assert r1.version == r2.version
     assert r1.status == r2.status
-    assert set(r1.reviewers) == set(r2.reviewers)
+    assert r1.reviewers == r2.reviewers
 
     # Compare subjects
     if r1.subject is None:
@@ -585,9 +620,8 @@ def assert_activities_equal(a1, a2) -> None:
     assert a1.category == a2.category
     assert a1.id == a2.id
 
-    # Content (optional for some types)
-    if hasattr(a1, "content"):
-        assert getattr(a1, "content", None) == getattr(a2, "content", None)
+    # Content (defined on every activity type, may be None)
+    assert a1.content == a2.content
 
     # Author
     if a1.author is None:
@@ -732,3 +766,132 @@ class TestCDATASerialization:
         assert restored.activities[0].content == "First <tag>"
         assert restored.activities[1].content == "Second & third"
         assert restored.activities[2].content == "Plain text"
+
+
+XML_WITH_ENTITIES = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE review [
+  <!ENTITY proj "OpenCodeReview">
+  <!ENTITY secret SYSTEM "file:///etc/hostname">
+]>
+<review>
+  <version>0.1</version>
+  <activities>
+    <activity>
+      <category>note</category>
+      <content>Hello &proj; team</content>
+    </activity>
+  </activities>
+</review>
+"""
+
+
+def test_xml_internal_entities_are_expanded(tmp_path: Path):
+    """Internal entities expand the same way from a path and a text stream."""
+    xml = XML_WITH_ENTITIES.replace('  <!ENTITY secret SYSTEM "file:///etc/hostname">\n', "")
+    path = tmp_path / "review.xml"
+    path.write_text(xml)
+
+    assert load(path).activities[0].content == "Hello OpenCodeReview team"
+    assert load(io.StringIO(xml), format="xml").activities[0].content == "Hello OpenCodeReview team"
+
+
+def test_xml_external_entities_are_rejected(tmp_path: Path):
+    """External entities are never read from disk."""
+    from xml.etree.ElementTree import ParseError
+
+    path = tmp_path / "review.xml"
+    path.write_text(XML_WITH_ENTITIES.replace("&proj;", "&secret;"))
+
+    with pytest.raises(ParseError):
+        load(path)
+
+
+def test_xml_loads_text_over_10_mb(tmp_path: Path):
+    """Large text nodes load, as they do with the standard library parser."""
+    content = "x" * (11 * 1024 * 1024)
+    path = tmp_path / "review.xml"
+    path.write_text(
+        "<review><version>0.1</version><activities><activity>"
+        f"<category>note</category><content>{content}</content>"
+        "</activity></activities></review>"
+    )
+
+    assert load(path).activities[0].content == content
+
+
+def test_xml_dump_writes_empty_text_as_empty_element():
+    """Empty text is written as <x />."""
+    from opencodereview import Comment, dump
+
+    review = Review(activities=[Comment(id="c1", category="note", content="")])
+    buf = io.StringIO()
+    dump(review, buf, format="xml")
+    assert "<content />" in buf.getvalue()
+
+
+def test_xml_dump_keeps_text_xml_cannot_represent():
+    """Control characters are written as-is."""
+    from opencodereview import Comment, dump
+
+    review = Review(activities=[Comment(id="c1", category="note", content="a\x01b")])
+    buf = io.StringIO()
+    dump(review, buf, format="xml")
+    assert "<content>a\x01b</content>" in buf.getvalue()
+
+
+def test_load_sees_rewrite_with_preserved_mtime(tmp_path: Path):
+    """A file rewritten at the same size and mtime loads its new content."""
+    path = tmp_path / "review.yaml"
+    path.write_text("activities:\n  - category: note\n    content: AAAA\n")
+    stat = path.stat()
+    assert load(path).activities[0].content == "AAAA"
+
+    path.write_text("activities:\n  - category: note\n    content: BBBB\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load(path).activities[0].content == "BBBB"
+
+
+@pytest.mark.parametrize("suffix", [".json", ".yaml"])
+def test_dump_integer_beyond_64_bits(tmp_path: Path, suffix: str):
+    """Integers too large for orjson are still written and read back."""
+    from opencodereview import dump
+
+    review = Review(metadata={"big": 2**70})
+    path = tmp_path / f"review{suffix}"
+    dump(review, path)
+    assert load(path).metadata == {"big": 2**70}
+
+    buf = io.StringIO()
+    dump(review, buf, format=suffix[1:])
+    assert str(2**70) in buf.getvalue()
+
+
+@pytest.mark.parametrize("yaml_example", YAML_EXAMPLES, ids=lambda p: p.name, indirect=True)
+def test_json_dump_is_the_same_without_orjson(
+    yaml_example: Review, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """The standard library fallback writes the same JSON bytes as orjson."""
+    pytest.importorskip("orjson")
+    from opencodereview import Comment, dump
+
+    non_ascii = Review(activities=[Comment(id="c1", category="note", content="héllo ✓")])
+    for review in (yaml_example, non_ascii):
+        path = tmp_path / "review.json"
+        dump(review, path)
+        with_orjson = path.read_bytes()
+
+        with monkeypatch.context() as m:
+            m.setattr("opencodereview.io.orjson", None)
+            dump(review, path)
+        assert path.read_bytes() == with_orjson
+
+
+def test_failed_dump_leaves_file_untouched(tmp_path: Path):
+    """dump() serializes before opening, so an error keeps the old file."""
+    from opencodereview import dump
+
+    path = tmp_path / "review.json"
+    path.write_text("original")
+    with pytest.raises(ValueError):
+        dump(Review(), path, format="toml")
+    assert path.read_text() == "original"